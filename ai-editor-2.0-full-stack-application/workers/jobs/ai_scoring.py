@@ -34,13 +34,13 @@ ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 # Interest score threshold for Newsletter Stories output
 INTEREST_SCORE_THRESHOLD = 15
 
-# Topic labels (18 fixed categories)
-VALID_TOPICS = [
+# Topic labels (18 fixed categories); a frozenset for O(1) validation
+VALID_TOPICS = frozenset({
     "WORK", "EDUCATION", "INFRASTRUCTURE", "HEALTHCARE", "ENVIRONMENT",
     "FINANCE", "RETAIL", "ENTERTAINMENT", "MANUFACTURING", "SECURITY",
     "TRANSPORTATION", "AGRICULTURE", "LEGAL", "REAL_ESTATE", "ENERGY",
     "GOVERNMENT", "COMMUNICATION", "OTHER"
-]
+})
 
 # Newsletter slugs for fit scoring
 NEWSLETTERS = ["pivot_ai", "pivot_build", "pivot_invest"]
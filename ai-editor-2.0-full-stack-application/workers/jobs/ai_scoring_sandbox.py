@@ -23,6 +23,7 @@ Query: {needs_ai} = 1
 """
 
 import os
+import re
 import json
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
@@ -53,16 +54,20 @@ ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY")
 # Firecrawl configuration
 FIRECRAWL_API_KEY = os.environ.get("FIRECRAWL_API_KEY")
 
+# Sites Firecrawl can't extract (paywalled); matched in one case-insensitive scan
+BLOCKED_DOMAINS = ("nytimes.com", "nyt.com")
+_BLOCKED_DOMAIN_RE = re.compile("|".join(map(re.escape, BLOCKED_DOMAINS)), re.IGNORECASE)
+
 # Interest score threshold for Newsletter Selects output
 INTEREST_SCORE_THRESHOLD = 15
 
-# Topic labels (18 fixed categories)
-VALID_TOPICS = [
+# Topic labels (18 fixed categories); a frozenset for O(1) validation
+VALID_TOPICS = frozenset({
     "WORK", "EDUCATION", "INFRASTRUCTURE", "HEALTHCARE", "ENVIRONMENT",
     "FINANCE", "RETAIL", "ENTERTAINMENT", "MANUFACTURING", "SECURITY",
     "TRANSPORTATION", "AGRICULTURE", "LEGAL", "REAL_ESTATE", "ENERGY",
     "GOVERNMENT", "COMMUNICATION", "OTHER"
-]
+})
 
 
 def extract_article_content(url: str) -> Optional[str]:
@@ -87,8 +92,7 @@ def extract_article_content(url: str) -> Optional[str]:
         return None
 
     # Skip known blocked sites
-    blocked_domains = ["nytimes.com", "nyt.com"]
-    if any(domain in url.lower() for domain in blocked_domains):
+    if _BLOCKED_DOMAIN_RE.search(url):
         print(f"[AI Scoring Sandbox] Skipping blocked site (NYT): {url[:50]}")
         return None
 
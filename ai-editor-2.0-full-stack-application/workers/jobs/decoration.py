@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Dict, Any
 import anthropic
 import google.generativeai as genai
-from ..utils.airtable import AirtableClient
+from ..utils.airtable import get_airtable_client
 
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 
@@ -37,7 +37,7 @@ def decorate_story(
     print(f"[Step 3] Decorating story {story_id} for slot {slot_order}")
 
     # Initialize clients
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
     claude = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
     genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
     gemini = genai.GenerativeModel('gemini-3-flash-preview')
@@ -9,7 +9,7 @@ Part of n8n workflow: NKjC8hb0EDHIXx3U
 import os
 from datetime import datetime
 from typing import Dict, Any, List
-from ..utils.airtable import AirtableClient
+from ..utils.airtable import get_airtable_client, gather
 
 # Newsletter HTML template
 EMAIL_TEMPLATE = '''<!DOCTYPE html>
@@ -95,7 +95,7 @@ def compile_newsletter_html(
     """
     print(f"[Step 4] Compiling newsletter HTML")
 
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
 
     if not issue_date:
         issue_date = datetime.now().strftime("%b %d, %Y")
@@ -106,8 +106,11 @@ def compile_newsletter_html(
         "started_at": datetime.now().isoformat(),
     }
 
-    # Get decorated stories for today
-    decorated_stories = airtable.get_decorated_stories_for_issue()
+    # Get decorated stories and today's selected slots (independent reads)
+    decorated_stories, selected_slots = gather(
+        airtable.get_decorated_stories_for_issue,
+        airtable.get_today_selected_slots,
+    )
 
     if len(decorated_stories) < 5:
         results["error"] = f"Only {len(decorated_stories)} stories decorated, need 5"
@@ -115,7 +118,6 @@ def compile_newsletter_html(
         return results
 
     # Get subject line from selected slots
-    selected_slots = airtable.get_today_selected_slots()
     subject_line = selected_slots.get('subject_line', f"Pivot 5 - {issue_date}")
 
     # Compile stories HTML
@@ -14,7 +14,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 import google.generativeai as genai
 import openai
-from ..utils.airtable import AirtableClient
+from ..utils.airtable import get_airtable_client
 
 
 def generate_image(
@@ -35,7 +35,7 @@ def generate_image(
     """
     print(f"[Step 3b] Generating image for story {story_id}")
 
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
 
     results = {
         "job_id": job_id,
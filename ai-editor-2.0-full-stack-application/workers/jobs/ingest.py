@@ -18,6 +18,7 @@ import asyncio
 import aiohttp
 import feedparser
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 from email.utils import parsedate_to_datetime
@@ -28,6 +29,7 @@ from redis import Redis
 from rq import Queue
 
 # Import local utilities
+from utils.airtable import _is_client_error
 from utils.pivot_id import generate_pivot_id
 from config.rss_feeds import get_feeds
 
@@ -247,6 +249,8 @@ ARTICLES_TABLE = os.environ.get(
     "AIRTABLE_ARTICLES_TABLE",
     "tblGumae8KDpsrWvh"  # Articles table - raw ingestion target
 )
+# Airtable accepts at most 10 records per create request
+AIRTABLE_BATCH_SIZE = 10
 
 # Redis configuration for job chaining
 REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379')
@@ -408,6 +412,54 @@ async def fetch_all_feeds(feeds: List[Dict[str, str]]) -> tuple[List[Dict[str, A
         return all_articles, resolved_count
 
 
+def create_article_records(table, records: List[Dict[str, Any]], results: Dict[str, Any]) -> None:
+    """
+    Create a batch of Articles records in one request.
+
+    If Airtable rejects the batch (4xx), records are retried one at a time
+    so one bad record doesn't drop the rest. Any other failure (timeout,
+    5xx) may come after the batch was written, so the chunk is logged as
+    failed instead of being created again.
+    """
+    try:
+        table.batch_create(records)
+        results["articles_ingested"] += len(records)
+        return
+    except Exception as e:
+        if not _is_client_error(e):
+            error_msg = f"Batch create failed for {len(records)} records, not retried: {str(e)}"
+            print(f"[Ingest] {error_msg}")
+            results["errors"].append(error_msg)
+            return
+        print(f"[Ingest] Batch create rejected ({e}), retrying records individually")
+
+    for record in records:
+        try:
+            table.create(record)
+            results["articles_ingested"] += 1
+        except Exception as e:
+            error_msg = f"Error creating record for {record['pivot_Id']}: {str(e)}"
+            print(f"[Ingest] {error_msg}")
+            results["errors"].append(error_msg)
+
+
+def load_existing_pivot_ids(table) -> set:
+    """
+    Load every pivot_Id already in the Articles table, for deduplication.
+
+    Note: Articles table uses "pivot_Id" (with underscore) as the key
+
+    The table grows every day, so pages are folded into the set as they
+    arrive rather than materializing every record first.
+    """
+    existing_pivot_ids = set()
+    for page in table.iterate(fields=["pivot_Id"], page_size=100):
+        existing_pivot_ids.update(
+            pivot_id for r in page if (pivot_id := r["fields"].get("pivot_Id"))
+        )
+    return existing_pivot_ids
+
+
 def ingest_articles(debug: bool = False) -> Dict[str, Any]:
     """
     Main ingestion job function.
@@ -450,6 +502,14 @@ def ingest_articles(debug: bool = False) -> Dict[str, Any]:
         results["feeds_count"] = len(feeds)
         print(f"[Ingest] Using {len(feeds)} feeds")
 
+        # Get existing pivot_Ids from Airtable for deduplication. The scan is
+        # independent of the feeds, so it runs on a background thread while
+        # the feeds are fetched.
+        print("[Ingest] Fetching existing pivot_Ids for deduplication...")
+        dedupe_pool = ThreadPoolExecutor(max_workers=1)
+        existing_future = dedupe_pool.submit(load_existing_pivot_ids, table)
+        dedupe_pool.shutdown(wait=False)
+
         # Fetch all articles from RSS feeds (includes Google News URL resolution)
         articles, google_news_resolved = asyncio.run(fetch_all_feeds(feeds))
         results["articles_found"] = len(articles)
@@ -461,22 +521,17 @@ def ingest_articles(debug: bool = False) -> Dict[str, Any]:
             results["completed_at"] = datetime.now(timezone.utc).isoformat()
             return results
 
-        # Get existing pivot_Ids from Airtable for deduplication
-        # Note: Articles table uses "pivot_Id" (with underscore) as the key
-        print("[Ingest] Fetching existing pivot_Ids for deduplication...")
         try:
-            existing_records = table.all(fields=["pivot_Id"])
-            existing_pivot_ids = {
-                r["fields"].get("pivot_Id")
-                for r in existing_records
-                if r["fields"].get("pivot_Id")
-            }
+            existing_pivot_ids = existing_future.result()
             print(f"[Ingest] Found {len(existing_pivot_ids)} existing records")
         except Exception as e:
             print(f"[Ingest] Warning: Could not fetch existing records: {e}")
             existing_pivot_ids = set()
 
-        # Process and create new records
+        # Process articles into new records, written in batches below.
+        # Records are created together, so they share one ingest timestamp.
+        new_records = []
+        ingested_at = datetime.now(timezone.utc).isoformat()
         for article in articles:
             # Skip if no URL and no title
             if not article["link"] and not article["title"]:
@@ -506,32 +561,30 @@ def ingest_articles(debug: bool = False) -> Dict[str, Any]:
             # Note: We don't have markdown since we're RSS-only (no Firecrawl)
             record = {
                 "pivot_Id": pivot_id,  # Primary deduplication key
-                "original_url": article["link"],  # Source URL
-                "source_id": article["source_id"],  # Publication name
-                "date_ingested": datetime.now(timezone.utc).isoformat(),  # When we ingested
+                "date_ingested": ingested_at,  # When we ingested
                 "needs_ai": True,  # Flag for AI Scoring job to pick up
             }
 
-            # Add optional fields if present
-            if article["pubDate"]:
-                record["date_published"] = article["pubDate"]
+            # Add optional fields only when set (Airtable doesn't like None),
+            # building the record once rather than copying it to drop Nones
+            if (link := article["link"]) is not None:
+                record["original_url"] = link  # Source URL
+            if (source_id := article["source_id"]) is not None:
+                record["source_id"] = source_id  # Publication name
+            if pub_date:
+                record["date_published"] = pub_date
 
             # Note: We don't have markdown content since we're RSS-only
             # The n8n workflow uses Firecrawl to get markdown, but we're
             # deliberately skipping that step for this implementation.
             # Pre-Filter (Step 1) will need to work with minimal data.
 
-            # Remove None values (Airtable doesn't like them)
-            record = {k: v for k, v in record.items() if v is not None}
+            new_records.append(record)
+            existing_pivot_ids.add(pivot_id)  # Prevent duplicates within batch
 
-            try:
-                table.create(record)
-                existing_pivot_ids.add(pivot_id)  # Prevent duplicates within batch
-                results["articles_ingested"] += 1
-            except Exception as e:
-                error_msg = f"Error creating record for {pivot_id}: {str(e)}"
-                print(f"[Ingest] {error_msg}")
-                results["errors"].append(error_msg)
+        # Create records 10 per request (Airtable's batch limit)
+        for i in range(0, len(new_records), AIRTABLE_BATCH_SIZE):
+            create_article_records(table, new_records[i:i + AIRTABLE_BATCH_SIZE], results)
 
         print(f"[Ingest] Ingestion complete:")
         print(f"  - Feeds fetched: {results['feeds_count']}")
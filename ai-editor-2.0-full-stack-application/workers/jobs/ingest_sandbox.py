@@ -113,12 +113,12 @@ def ingest_articles_sandbox(
         # Get existing pivot_ids from Airtable for deduplication
         print("[Ingest Sandbox] Fetching existing records for deduplication...")
         try:
-            existing_records = table.all(fields=["pivot_id"])
-            existing_pivot_ids = {
-                r["fields"].get("pivot_id")
-                for r in existing_records
-                if r["fields"].get("pivot_id")
-            }
+            # Fold pages into the set as they arrive instead of holding every record
+            existing_pivot_ids = set()
+            for page in table.iterate(fields=["pivot_id"], page_size=100):
+                existing_pivot_ids.update(
+                    pivot_id for r in page if (pivot_id := r["fields"].get("pivot_id"))
+                )
             print(f"[Ingest Sandbox] Found {len(existing_pivot_ids)} existing records")
         except Exception as e:
             print(f"[Ingest Sandbox] Warning: Could not fetch existing records: {e}")
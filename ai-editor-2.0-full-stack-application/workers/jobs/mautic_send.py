@@ -11,7 +11,7 @@ import base64
 from datetime import datetime
 from typing import Dict, Any
 import httpx
-from ..utils.airtable import AirtableClient
+from ..utils.airtable import get_airtable_client
 
 
 def send_via_mautic(
@@ -34,7 +34,7 @@ def send_via_mautic(
     """
     print(f"[Step 4b] Sending newsletter via Mautic: {issue_id}")
 
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
 
     results = {
         "job_id": job_id,
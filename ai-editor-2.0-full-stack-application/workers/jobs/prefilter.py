@@ -8,10 +8,16 @@ Replaces n8n workflow: VoSZu0MIJAw1IuLL
 """
 
 import os
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional
 import google.generativeai as genai
-from ..utils.airtable import AirtableClient
+from google.api_core import exceptions as google_exceptions
+from ..utils.airtable import get_airtable_client
+from ..utils.rate_limit import RateLimiter, call_with_retry
 
 # Slot eligibility criteria
 SLOT_CRITERIA = {
@@ -37,6 +43,44 @@ SLOT_CRITERIA = {
     },
 }
 
+# Freshness-eligible slots per age bucket (see SLOT_CRITERIA):
+# <=24h, <=48h, <=7 days, older. Shared tuples, no per-story allocation.
+_BUCKET_LIMITS_HOURS = (24, 48, 168)
+_SLOTS_BY_BUCKET = ((1, 2, 3, 4, 5), (2, 3, 4, 5), (3, 5), ())
+
+
+def _slot_mask(slots) -> int:
+    """Pack slot numbers into a bitmask (bit 0 = slot 1)"""
+    mask = 0
+    for slot in slots:
+        mask |= 1 << (slot - 1)
+    return mask
+
+
+# Slot sets as bitmasks: freshness per bucket, and mask -> ordered slot tuple
+_FRESH_MASKS = tuple(_slot_mask(slots) for slots in _SLOTS_BY_BUCKET)
+_SLOTS_BY_MASK = tuple(
+    tuple(slot for slot in range(1, 6) if mask & (1 << (slot - 1)))
+    for mask in range(32)
+)
+# Stories with no usable publish date: Gemini judges freshness from the raw date
+_UNKNOWN_AGE_MASK = _slot_mask(range(1, 6))
+
+# Concurrent Gemini requests; kept low to stay under Gemini rate limits
+PREFILTER_MAX_WORKERS = 3
+
+# Gemini request rate shared by all pre-filter workers
+GEMINI_MAX_RPS = float(os.getenv('GEMINI_MAX_RPS', '5'))
+_gemini_limiter = RateLimiter(GEMINI_MAX_RPS)
+
+# Transient Gemini errors worth retrying (rate limits, overload, timeouts)
+_GEMINI_RETRYABLE = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+)
+
 
 def prefilter_stories(job_id: str = None) -> Dict[str, Any]:
     """
@@ -51,68 +95,160 @@ def prefilter_stories(job_id: str = None) -> Dict[str, Any]:
     print(f"[Step 1] Starting pre-filter job {job_id or 'manual'}")
 
     # Initialize clients
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
     genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
     model = genai.GenerativeModel('gemini-3-flash-preview')
 
-    # Get fresh stories from Newsletter Stories table (last 7 days)
-    seven_days_ago = (datetime.now() - timedelta(days=7)).isoformat()
-    stories = airtable.get_newsletter_stories(since_date=seven_days_ago)
+    # One UTC clock read for the query cutoff and story ages
+    now_utc = datetime.now(timezone.utc)
+
+    # Airtable reads: source scores are independent, so fetch them in the
+    # background while yesterday's issue loads
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Get source credibility scores
+        source_scores_future = pool.submit(airtable.get_source_scores)
+
+        # Get yesterday's issue to avoid repeats
+        yesterday_stories = airtable.get_yesterday_selected_stories()
+        yesterday_ids = {s.get('storyID') for s in yesterday_stories}
 
-    # Get source credibility scores
-    source_scores = airtable.get_source_scores()
+        source_scores = source_scores_future.result()
 
-    # Get yesterday's issue to avoid repeats
-    yesterday_stories = airtable.get_yesterday_selected_stories()
-    yesterday_ids = {s.get('storyID') for s in yesterday_stories}
+    # Stream fresh stories from Newsletter Stories table (last 7 days),
+    # excluding yesterday's picks server-side. Pages are fetched as the loop
+    # below consumes them, so Gemini calls start before the last page lands.
+    seven_days_ago = (now_utc - timedelta(days=7)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    stories = airtable.iter_newsletter_stories(
+        since_date=seven_days_ago,
+        exclude_story_ids=sorted(yesterday_ids - {None}),
+    )
 
     results = {
         "job_id": job_id,
         "started_at": datetime.now().isoformat(),
         "stories_processed": 0,
         "slots": {1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
+        "skip_reasons": Counter(),
+        "unknown_date": 0,
+        "retries": 0,
         "errors": [],
     }
 
-    for story in stories:
-        story_id = story.get('storyID')
-
-        # Skip if in yesterday's issue
-        if story_id in yesterday_ids:
-            continue
-
-        # Get source credibility
-        source = story.get('source_id', 'unknown')
-        credibility = source_scores.get(source, 3)  # Default to 3
-
-        # Determine eligible slots using Gemini
-        try:
-            eligible_slots = _evaluate_slot_eligibility(
-                model=model,
-                story=story,
-                credibility=credibility,
+    # Determine eligible slots using Gemini. Each call is an independent
+    # HTTP round trip, so run them concurrently and collect results as they land.
+    # Pre-Filter Log entries are flushed in batches as they accumulate, so
+    # the writes overlap with the Gemini calls still in flight
+    log_buffer = airtable.batched_prefilter_logs()
+    retries = []
+    prefiltered_at = datetime.now().isoformat()
+    with ThreadPoolExecutor(max_workers=PREFILTER_MAX_WORKERS) as pool:
+        # Submit stories as they stream in, skipping anything in yesterday's
+        # issue and repeat records for a story already seen
+        futures = {}
+        seen_ids = set()
+        for story in stories:
+            get = story.get
+            story_id = get('storyID')
+            if story_id in yesterday_ids:
+                results["skip_reasons"]["yesterday"] += 1
+                continue
+            if story_id in seen_ids:
+                results["skip_reasons"]["duplicate"] += 1
+                continue
+            seen_ids.add(story_id)
+
+            # Get source credibility
+            credibility = source_scores.get(get('source_id', 'unknown'), 3)  # Default to 3
+            hours_ago = _calculate_hours_ago(get('date_og_published'), now_utc)
+
+            # Too old for every slot, no need to ask Gemini. A missing or
+            # malformed date isn't "old", so those stories go to Gemini with
+            # every slot open, as they always did.
+            if hours_ago is None:
+                results["unknown_date"] += 1
+                fresh_mask = _UNKNOWN_AGE_MASK
+            else:
+                fresh_mask = _calculate_eligible_slots(hours_ago)
+            if not fresh_mask:
+                results["skip_reasons"]["too_old"] += 1
+                continue
+
+            # Workers only need the prompt fields, not the full Airtable record
+            headline = get('ai_headline') or get('headline', '')
+            future = pool.submit(
+                _evaluate_slot_eligibility,
+                model,
+                headline,
+                f"{get('ai_dek') or ''} {get('ai_bullet_1') or ''}",
+                get('date_og_published', ''),
+                credibility,
+                hours_ago,
+                on_retry=retries.append,
             )
-
-            # Write to Pre-Filter Log
-            for slot in eligible_slots:
-                airtable.create_prefilter_log({
-                    "article_id": story_id,
-                    "storyID": story_id,
-                    "pivotId": story.get('pivotId'),
-                    "headline": story.get('ai_headline', story.get('headline', '')),
-                    "date_og_published": story.get('date_og_published'),
-                    "date_prefiltered": datetime.now().isoformat(),
-                    "slot": slot,
+            futures[future] = (story, headline, fresh_mask)
+
+        for future in as_completed(futures):
+            story, headline, fresh_mask = futures[future]
+            get = story.get
+            story_id = get('storyID')
+
+            try:
+                # Gemini judges content; freshness rules are enforced here
+                # (one AND of bitmasks, which also drops repeated slots)
+                eligible_slots = _SLOTS_BY_MASK[_slot_mask(future.result()) & fresh_mask]
+                if not eligible_slots:
+                    results["skip_reasons"]["no_eligible_slots"] += 1
+                else:
+                    # Shared payload, built once per story
+                    base_record = {
+                        "article_id": story_id,
+                        "storyID": story_id,
+                        "pivotId": get('pivotId'),
+                        "headline": headline,
+                        "date_og_published": get('date_og_published'),
+                        "date_prefiltered": prefiltered_at,
+                    }
+
+                    # Queue one Pre-Filter Log entry per eligible slot; a
+                    # failed flush keeps its records for the final flush
+                    try:
+                        log_buffer.extend({**base_record, "slot": slot} for slot in eligible_slots)
+                    except Exception as e:
+                        print(f"[Step 1] Pre-filter log flush failed ({e}), unsent entries retried at end")
+
+                results["stories_processed"] += 1
+
+            except Exception as e:
+                results["errors"].append({
+                    "story_id": story_id,
+                    "error": str(e),
                 })
-                results["slots"][slot] += 1
-
-            results["stories_processed"] += 1
 
-        except Exception as e:
-            results["errors"].append({
-                "story_id": story_id,
-                "error": str(e),
-            })
+    results["retries"] = len(retries)
+    if retries:
+        print(f"[Step 1] Gemini requests retried {len(retries)} times")
+
+    if results["skip_reasons"]:
+        print(f"[Step 1] Skip breakdown: {dict(results['skip_reasons'])}")
+    if results["unknown_date"]:
+        print(f"[Step 1] {results['unknown_date']} stories had no parseable publish date")
+
+    # Write whatever is still buffered to Pre-Filter Log
+    try:
+        log_buffer.flush()
+    except Exception as e:
+        results["errors"].append({
+            "prefilter_log": str(e),
+        })
+    for records, error in log_buffer.rejected:
+        results["errors"].append({
+            "prefilter_log": f"{len(records)} entries not written: {error}",
+        })
+
+    # Count only the entries that actually landed
+    for record in log_buffer.written:
+        slot = int(record['fields']['slot'])
+        results["slots"][slot] += 1
 
     results["completed_at"] = datetime.now().isoformat()
     print(f"[Step 1] Pre-filter complete: {results['stories_processed']} stories, {sum(results['slots'].values())} slot entries")
@@ -120,32 +256,88 @@ def prefilter_stories(job_id: str = None) -> Dict[str, Any]:
     return results
 
 
+def _calculate_eligible_slots(hours_ago: int) -> int:
+    """
+    Get the slots a story is fresh enough for.
+
+    Args:
+        hours_ago: Hours since the story was published
+
+    Returns:
+        Slot bitmask, bit 0 = slot 1 (0 if too old for every slot)
+    """
+    return _FRESH_MASKS[bisect_left(_BUCKET_LIMITS_HOURS, hours_ago)]
+
+
+@lru_cache(maxsize=2048)
+def _parse_published(date_str: str) -> Optional[datetime]:
+    """
+    Parse an ISO date/datetime string into an aware UTC-based datetime.
+
+    Cached on the raw string: stories polled from the same feed often share
+    identical timestamps. Only the parse is cached, never the age.
+
+    Returns:
+        Timezone-aware datetime, or None if unparseable
+    """
+    try:
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1] + '+00:00'
+        published = datetime.fromisoformat(date_str)
+    except (AttributeError, ValueError, TypeError):
+        return None
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published
+
+
+def _calculate_hours_ago(date_str: Optional[str], now_utc: datetime) -> Optional[int]:
+    """
+    Calculate how many whole hours ago an ISO date/datetime string was.
+
+    Args:
+        date_str: ISO date ('2025-01-15') or datetime ('2025-01-15T08:00:00.000Z')
+        now_utc: Current time (timezone-aware UTC), computed once by the caller
+
+    Returns:
+        Hours since the date, or None if it is missing or unparseable
+    """
+    published = _parse_published(date_str) if isinstance(date_str, str) else None
+    if published is None:
+        return None
+    return int((now_utc - published).total_seconds() // 3600)
+
+
 def _evaluate_slot_eligibility(
     model: Any,
-    story: Dict[str, Any],
+    headline: str,
+    summary: str,
+    date_published: str,
     credibility: int,
+    hours_ago: Optional[int],
+    on_retry: Callable[[Exception], None] = None,
 ) -> List[int]:
     """
     Use Gemini to evaluate which slots a story is eligible for.
 
     Args:
         model: Gemini model instance
-        story: Story data from Airtable
+        headline: Story headline
+        summary: Dek plus first bullet
+        date_published: Original publish date
         credibility: Source credibility score (1-5)
+        hours_ago: Hours since the story was published, or None if unknown
 
     Returns:
         List of eligible slot numbers (1-5)
     """
-    headline = story.get('ai_headline', story.get('headline', ''))
-    content = story.get('ai_dek', '') + ' ' + story.get('ai_bullet_1', '')
-    date_published = story.get('date_og_published', '')
-
+    age = f"{hours_ago} hours ago" if hours_ago is not None else "age unknown"
     prompt = f"""Analyze this news article and determine which newsletter slots it's eligible for.
 
 ARTICLE:
 Headline: {headline}
-Summary: {content}
-Published: {date_published}
+Summary: {summary}
+Published: {date_published} ({age})
 Source Credibility: {credibility}/5
 
 SLOT CRITERIA:
@@ -158,7 +350,13 @@ SLOT CRITERIA:
 Return ONLY a comma-separated list of eligible slot numbers (e.g., "1,3,5" or "2" or "none").
 Consider both content relevance AND freshness requirements."""
 
-    response = model.generate_content(prompt)
+    # Rate-limited, with backoff on transient errors
+    response = call_with_retry(
+        lambda: model.generate_content(prompt),
+        retry_on=_GEMINI_RETRYABLE,
+        limiter=_gemini_limiter,
+        on_retry=on_retry,
+    )
     result = response.text.strip().lower()
 
     if result == 'none':
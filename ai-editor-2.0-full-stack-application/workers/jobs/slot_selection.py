@@ -1,28 +1,57 @@
 """
 Step 2: Slot Selection
 
-5 sequential Claude agent calls select one story per slot, tracking previously
-selected companies/sources/IDs to enforce diversity rules.
+5 Claude agent calls select one story per slot, tracking previously
+selected companies/sources/IDs to enforce diversity rules. All 5 slots run
+speculatively in parallel; picks are committed in slot order and a slot is
+re-run if it collides with an earlier one.
 
 Replaces n8n workflow: SZmPztKNEmisG3Zf
 """
 
 import os
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Tuple
 import anthropic
-from ..utils.airtable import AirtableClient
+from redis import Redis
+from ..utils.airtable import AirtableClient, get_airtable_client
+from ..utils.claude import create_message
+
+logger = logging.getLogger(__name__)
 
 # Claude model for slot selection
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 
+# Concurrent slot selections (one per slot)
+SLOT_MAX_WORKERS = 5
+
+# Editorial rule: at most this many stories per source per day
+MAX_STORIES_PER_SOURCE = 2
+
+# Subject line source: "llm" (Claude) or "template" (built from the top
+# headlines without an API call)
+SUBJECT_MODE = os.getenv('P5_SUBJECT_MODE', 'llm')
+
+# Generated subject lines are cached in Redis by headline set, so re-runs
+# with the same picks skip the Claude call
+SUBJECT_CACHE_TTL = 24 * 60 * 60
+SUBJECT_CACHE_PREFIX = "p5:subject_line:"
+
+_redis: Optional[Redis] = None
 
-def select_slots(job_id: str = None) -> Dict[str, Any]:
+
+def select_slots(job_id: str = None, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Select one story for each of the 5 newsletter slots using Claude agents.
 
     Args:
         job_id: Optional job ID for tracking
+        force_refresh: Drop cached Airtable reads (e.g. yesterday's issue)
+            before running, for manual re-runs after editing records
 
     Returns:
         Dict with selected stories and subject line
@@ -30,78 +59,102 @@ def select_slots(job_id: str = None) -> Dict[str, Any]:
     print(f"[Step 2] Starting slot selection job {job_id or 'manual'}")
 
     # Initialize clients
-    airtable = AirtableClient()
-    client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+    if force_refresh:
+        AirtableClient.clear_cache()
+    airtable = get_airtable_client()
+    # Slots run concurrently and can hit 429s; create_message retries them
+    # under the process-wide Claude gate and rate limiter instead of the SDK
+    client = anthropic.Anthropic(
+        api_key=os.getenv('ANTHROPIC_API_KEY'),
+        max_retries=0,
+    )
+
+    # One clock read per run so the issue date and candidate date agree
+    now = datetime.now()
+
+    # Opening Airtable reads are independent; run them concurrently
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Get candidates for every slot in one query
+        candidates_future = pool.submit(
+            airtable.get_prefilter_candidates_by_slot,
+            date=now.strftime('%Y-%m-%d'),
+        )
 
-    # Get yesterday's issue for context
-    yesterday = airtable.get_yesterday_selected_stories()
+        # Get yesterday's issue for context
+        yesterday = airtable.get_yesterday_selected_stories()
 
     # Track what we've already selected today
     selected_story_ids: Set[str] = set()
     selected_companies: Set[str] = set()
-    selected_sources: Set[str] = set()
+    selected_sources: Counter = Counter()
 
     # Yesterday's data for rules
     yesterday_companies = {s.get('company', '') for s in yesterday if s.get('company')}
     yesterday_slot1_company = yesterday[0].get('company', '') if yesterday else ''
+    # Invariant across slots; built once
+    yesterday_ids = frozenset(s.get('storyID') for s in yesterday if s.get('storyID'))
 
     results = {
         "job_id": job_id,
-        "started_at": datetime.now().isoformat(),
-        "issue_date": f"Pivot 5 - {datetime.now().strftime('%b %d')}",
+        "started_at": now.isoformat(),
+        "issue_date": f"Pivot 5 - {now.strftime('%b %d')}",
         "slots": {},
         "subject_line": "",
         "errors": [],
     }
 
-    # Process each slot sequentially
-    for slot_num in range(1, 6):
-        print(f"[Step 2] Processing slot {slot_num}...")
+    try:
+        candidates_by_slot = candidates_future.result()
+    except Exception as e:
+        results["errors"].append({
+            "candidates": str(e),
+        })
+        candidates_by_slot = {slot_num: [] for slot_num in range(1, 6)}
 
-        try:
-            # Get candidates for this slot
-            candidates = airtable.get_prefilter_candidates(slot=slot_num)
-
-            # Filter out already selected stories
-            candidates = [c for c in candidates if c.get('storyID') not in selected_story_ids]
-
-            if not candidates:
-                results["errors"].append({
-                    "slot": slot_num,
-                    "error": "No candidates available",
-                })
-                continue
-
-            # Select best story using Claude
-            selected = _select_story_for_slot(
-                client=client,
-                slot_num=slot_num,
-                candidates=candidates,
-                selected_companies=selected_companies,
-                selected_sources=selected_sources,
-                yesterday_companies=yesterday_companies,
-                yesterday_slot1_company=yesterday_slot1_company if slot_num == 1 else None,
+    # Resolve storyIDs and drop yesterday's stories once, not on every (re-)run
+    indexed_by_slot = {
+        slot_num: _index_candidates(candidates, yesterday_ids)
+        for slot_num, candidates in candidates_by_slot.items()
+    }
+
+    def run_slot(slot_num: int, story_ids: Set[str], companies: Set[str], sources: Counter):
+        return _run_slot(
+            client=client,
+            slot_num=slot_num,
+            indexed_candidates=indexed_by_slot[slot_num],
+            selected_story_ids=story_ids,
+            selected_companies=companies,
+            selected_sources=sources,
+            yesterday_companies=yesterday_companies,
+            yesterday_slot1_company=yesterday_slot1_company if slot_num == 1 else None,
+        )
+
+    # All 5 slots run speculatively in parallel against the initial state
+    print("[Step 2] Processing slots 1-5 in parallel...")
+    with ThreadPoolExecutor(max_workers=SLOT_MAX_WORKERS) as pool:
+        futures = {
+            slot_num: pool.submit(
+                run_slot,
+                slot_num,
+                set(selected_story_ids),
+                set(selected_companies),
+                Counter(selected_sources),
             )
+            for slot_num in range(1, 6)
+        }
+
+    # Commit in slot order; a pick that collides with a higher-priority slot
+    # is re-run once against the up-to-date state (rare path)
+    for slot_num in range(1, 6):
+        try:
+            selected = futures[slot_num].result()
+
+            if selected and _collides(selected, selected_story_ids, selected_companies, selected_sources):
+                print(f"[Step 2] Slot {slot_num} collided with an earlier pick, re-running...")
+                selected = run_slot(slot_num, selected_story_ids, selected_companies, selected_sources)
 
             if selected:
-                story_id = selected.get('storyID')
-                selected_story_ids.add(story_id)
-
-                # Extract company/source for tracking
-                company = selected.get('company', '')
-                source = selected.get('source_id', '')
-                if company:
-                    selected_companies.add(company)
-                if source:
-                    selected_sources.add(source)
-
-                results["slots"][slot_num] = {
-                    "storyId": story_id,
-                    "pivotId": selected.get('pivotId'),
-                    "headline": selected.get('headline'),
-                    "company": company,
-                    "source": source,
-                }
+                _record_selection(results, slot_num, selected, selected_story_ids, selected_companies, selected_sources)
 
         except Exception as e:
             results["errors"].append({
@@ -129,12 +182,127 @@ def select_slots(job_id: str = None) -> Dict[str, Any]:
     return results
 
 
+def _index_candidates(
+    candidates: List[Dict[str, Any]],
+    excluded_ids: FrozenSet[str],
+) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    Pair each candidate with its storyID, dropping candidates without one and
+    those in excluded_ids (yesterday's issue).
+
+    Returns:
+        List of (candidate, storyID) tuples
+    """
+    excluded = excluded_ids.__contains__
+    indexed = []
+    for c in candidates:
+        story_id = c.get('storyID')
+        if story_id and not excluded(story_id):
+            indexed.append((c, story_id))
+    return indexed
+
+
+def _run_slot(
+    client: anthropic.Anthropic,
+    slot_num: int,
+    indexed_candidates: List[Tuple[Dict[str, Any], str]],
+    selected_story_ids: Set[str],
+    selected_companies: Set[str],
+    selected_sources: Counter,
+    yesterday_companies: Set[str],
+    yesterday_slot1_company: str = None,
+) -> Dict[str, Any]:
+    """
+    Select one story for a slot from its pre-filter candidates with Claude.
+
+    indexed_candidates comes from _index_candidates. Candidates already
+    selected today or from a source already at its daily cap are skipped.
+
+    Raises:
+        ValueError: If no candidates remain for the slot
+
+    Returns:
+        Selected story dict or None
+    """
+    # Index by storyID, dropping already selected stories and any duplicate
+    # Pre-Filter Log rows for the same story
+    candidates_by_id: Dict[str, Dict[str, Any]] = {}
+    for c, story_id in indexed_candidates:
+        if (
+            story_id in selected_story_ids
+            or story_id in candidates_by_id
+            or selected_sources[c.get('source_id')] >= MAX_STORIES_PER_SOURCE
+        ):
+            continue
+        candidates_by_id[story_id] = c
+
+    if not candidates_by_id:
+        raise ValueError("No candidates available")
+
+    return _select_story_for_slot(
+        client=client,
+        slot_num=slot_num,
+        candidates_by_id=candidates_by_id,
+        selected_companies=selected_companies,
+        selected_sources=selected_sources,
+        yesterday_companies=yesterday_companies,
+        yesterday_slot1_company=yesterday_slot1_company,
+    )
+
+
+def _collides(
+    selected: Dict[str, Any],
+    selected_story_ids: Set[str],
+    selected_companies: Set[str],
+    selected_sources: Counter,
+) -> bool:
+    """
+    Check whether a speculative pick conflicts with already-committed picks:
+    same story, same company, or a source already at its daily cap.
+    """
+    if selected.get('storyID') in selected_story_ids:
+        return True
+    company = selected.get('company', '')
+    if company and company in selected_companies:
+        return True
+    return selected_sources[selected.get('source_id')] >= MAX_STORIES_PER_SOURCE
+
+
+def _record_selection(
+    results: Dict[str, Any],
+    slot_num: int,
+    selected: Dict[str, Any],
+    selected_story_ids: Set[str],
+    selected_companies: Set[str],
+    selected_sources: Counter,
+) -> None:
+    """Record a selected story and update the diversity tracking state."""
+    story_id = selected.get('storyID')
+    selected_story_ids.add(story_id)
+
+    # Extract company/source for tracking
+    company = selected.get('company', '')
+    source = selected.get('source_id', '')
+    if company:
+        selected_companies.add(company)
+    if source:
+        selected_sources[source] += 1
+
+    results["slots"][slot_num] = {
+        "storyId": story_id,
+        "pivotId": selected.get('pivotId'),
+        "headline": selected.get('headline'),
+        "company": company,
+        "source": source,
+    }
+
+
 def _select_story_for_slot(
     client: anthropic.Anthropic,
     slot_num: int,
-    candidates: List[Dict[str, Any]],
+    candidates_by_id: Dict[str, Dict[str, Any]],
     selected_companies: Set[str],
-    selected_sources: Set[str],
+    selected_sources: Counter,
     yesterday_companies: Set[str],
     yesterday_slot1_company: str = None,
 ) -> Dict[str, Any]:
@@ -144,9 +312,9 @@ def _select_story_for_slot(
     Args:
         client: Anthropic client
         slot_num: Slot number (1-5)
-        candidates: List of candidate stories
+        candidates_by_id: Candidate stories keyed by storyID
         selected_companies: Companies already selected today
-        selected_sources: Sources already selected today
+        selected_sources: Stories selected today per source
         yesterday_companies: Companies from yesterday's issue
         yesterday_slot1_company: Company from yesterday's slot 1 (for slot 1 only)
 
@@ -161,6 +329,8 @@ def _select_story_for_slot(
         5: "Consumer AI and human interest - ethics, entertainment, societal impact, fun or quirky uses. Choose the most engaging, shareable story.",
     }
 
+    candidates = list(candidates_by_id.values())
+
     # Build candidates text
     candidates_text = ""
     for i, c in enumerate(candidates[:15], 1):  # Limit to 15 candidates
@@ -175,9 +345,12 @@ def _select_story_for_slot(
     # Build exclusion rules
     exclusions = []
     if selected_companies:
-        exclusions.append(f"Already selected companies today: {', '.join(selected_companies)}")
-    if selected_sources and len([s for s in candidates if s.get('source_id') in selected_sources]) >= 2:
-        exclusions.append(f"Sources at 2/day limit: {', '.join(selected_sources)}")
+        exclusions.append(f"Already selected companies today: {', '.join(sorted(selected_companies))}")
+    sources_at_cap = sorted(
+        source for source, count in selected_sources.items() if count >= MAX_STORIES_PER_SOURCE
+    )
+    if sources_at_cap:
+        exclusions.append(f"Sources at {MAX_STORIES_PER_SOURCE}/day limit: {', '.join(sources_at_cap)}")
     if slot_num == 1 and yesterday_slot1_company:
         exclusions.append(f"Yesterday's Slot 1 company (avoid for 2-day rotation): {yesterday_slot1_company}")
 
@@ -202,7 +375,8 @@ EDITORIAL GUIDELINES:
 Select the single best story for this slot. Return ONLY the story ID (e.g., "recXYZ123").
 If no suitable story exists, return "NONE"."""
 
-    response = client.messages.create(
+    response = create_message(
+        client,
         model=CLAUDE_MODEL,
         max_tokens=100,
         messages=[{"role": "user", "content": prompt}],
@@ -214,11 +388,7 @@ If no suitable story exists, return "NONE"."""
         return None
 
     # Find the selected story in candidates
-    for c in candidates:
-        if c.get('storyID') == selected_id:
-            return c
-
-    return None
+    return candidates_by_id.get(selected_id)
 
 
 def _generate_subject_line(
@@ -240,6 +410,14 @@ def _generate_subject_line(
         if slot_num in selected_slots:
             headlines.append(f"Slot {slot_num}: {selected_slots[slot_num].get('headline', 'TBD')}")
 
+    if SUBJECT_MODE == 'template':
+        return _template_subject_line(selected_slots)
+
+    cache_key = SUBJECT_CACHE_PREFIX + hashlib.sha1("\n".join(headlines).encode()).hexdigest()
+    cached = _subject_cache_get(cache_key)
+    if cached:
+        return cached
+
     prompt = f"""Generate a compelling email subject line for the Pivot 5 AI newsletter.
 
 TODAY'S STORIES:
@@ -254,10 +432,57 @@ GUIDELINES:
 
 Return ONLY the subject line, no quotes or explanation."""
 
-    response = client.messages.create(
+    response = create_message(
+        client,
         model=CLAUDE_MODEL,
         max_tokens=100,
         messages=[{"role": "user", "content": prompt}],
     )
 
-    return response.content[0].text.strip()
+    subject_line = response.content[0].text.strip()
+    _subject_cache_set(cache_key, subject_line)
+    return subject_line
+
+
+def _template_subject_line(selected_slots: Dict[int, Dict[str, Any]]) -> str:
+    """Build a subject line (max 60 chars) from the top two headlines."""
+    headlines = [
+        selected_slots[slot_num].get('headline') or ''
+        for slot_num in range(1, 6)
+        if slot_num in selected_slots
+    ]
+    headlines = [h for h in headlines if h]
+    if not headlines:
+        return "Pivot 5: Today's AI News"
+    if len(headlines) == 1:
+        return headlines[0][:60].rstrip()
+    return " • ".join(h[:28].rstrip() for h in headlines[:2])
+
+
+def _get_redis() -> Redis:
+    """Get a shared Redis connection for the subject line cache."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            os.getenv('REDIS_URL', 'redis://localhost:6379'),
+            socket_timeout=2,
+            decode_responses=True,
+        )
+    return _redis
+
+
+def _subject_cache_get(key: str) -> Optional[str]:
+    """Look up a cached subject line; cache errors are non-fatal."""
+    try:
+        return _get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Subject line cache read failed: {e}")
+        return None
+
+
+def _subject_cache_set(key: str, subject_line: str) -> None:
+    """Store a generated subject line; cache errors are non-fatal."""
+    try:
+        _get_redis().set(key, subject_line, ex=SUBJECT_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Subject line cache write failed: {e}")
@@ -6,10 +6,26 @@ Syndicates decorated stories to social media posting queue.
 Replaces n8n workflow: I8U8LgJVDsO8PeBJ
 """
 
-import os
+import re
 from datetime import datetime
-from typing import Dict, Any, List
-from ..utils.airtable import AirtableClient
+from typing import Dict, Any, List, Optional, Tuple
+from ..utils.airtable import AirtableClient, _is_client_error, get_airtable_client
+
+# Stories synced per run (one issue is 5 stories; backlog drains next run)
+SOCIAL_SYNC_BATCH_SIZE = 10
+
+# Topic label per slot number
+SLOT_LABELS = {
+    1: "Impact",
+    2: "Big Tech",
+    3: "Industry",
+    4: "Emerging",
+    5: "Human Interest",
+}
+
+# Markup stripped from bullets before posting
+_MARKDOWN_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 
 def sync_to_social(job_id: str = None) -> Dict[str, Any]:
@@ -24,7 +40,7 @@ def sync_to_social(job_id: str = None) -> Dict[str, Any]:
     """
     print(f"[Step 5] Syncing to social posts")
 
-    airtable = AirtableClient()
+    airtable = get_airtable_client()
 
     results = {
         "job_id": job_id,
@@ -35,49 +51,54 @@ def sync_to_social(job_id: str = None) -> Dict[str, Any]:
     }
 
     # Get decorated stories that need social sync
-    stories = airtable.get_stories_for_social_sync()
+    stories = airtable.get_stories_for_social_sync(max_records=SOCIAL_SYNC_BATCH_SIZE)
+
+    # Check which already exist in social posts with batched lookups
+    existing_ids = airtable.get_existing_social_post_ids([s.get('storyID') for s in stories])
 
+    # Build social post records for stories not yet synced
+    created_at = datetime.now().isoformat()
+    to_sync = []
+    already_posted = []
     for story in stories:
         story_id = story.get('storyID')
 
-        try:
-            # Check if already exists in social posts
-            if airtable.social_post_exists(story_id):
-                results["skipped"].append({
-                    "story_id": story_id,
-                    "reason": "already_exists",
-                })
-                continue
-
-            # Create social post record
-            social_post = {
-                "source_record_id": story_id,
-                "headline": story.get('ai_headline', ''),
-                "label": _get_label_for_slot(story.get('slot_order', 1)),
-                "b1": _clean_html(story.get('ai_bullet_1', '')),
-                "b2": _clean_html(story.get('ai_bullet_2', '')),
-                "b3": _clean_html(story.get('ai_bullet_3', '')),
-                "image_raw_url": story.get('image_url', ''),
-                "publish_status": "ready",
-                "order": story.get('slot_order', 99),
-                "created_at": datetime.now().isoformat(),
-            }
-
-            airtable.create_social_post(social_post)
-
-            # Mark story as synced
-            airtable.update_story_social_status(story_id, "synced")
-
-            results["synced"].append({
+        # Skip if already exists in social posts
+        if story_id in existing_ids:
+            results["skipped"].append({
                 "story_id": story_id,
-                "headline": story.get('ai_headline', '')[:50],
+                "reason": "already_exists",
             })
+            already_posted.append(story)
+            continue
 
-        except Exception as e:
-            results["errors"].append({
+        social_post = _build_social_post(story, created_at)
+        if not social_post:
+            results["skipped"].append({
                 "story_id": story_id,
-                "error": str(e),
+                "reason": "missing_content",
             })
+            continue
+        to_sync.append((story, social_post))
+
+    # Write in Airtable-sized batches
+    batch_size = AirtableClient.WRITE_BATCH_SIZE
+    for i in range(0, len(to_sync), batch_size):
+        batch = to_sync[i:i + batch_size]
+
+        # Create social post records
+        created = _create_social_posts(airtable, batch, results)
+
+        # Mark stories as synced
+        _record_synced(results, _mark_stories_synced(airtable, created, results))
+
+    # Stories whose post already exists were never marked synced (e.g. an
+    # earlier run died between create and update). Mark them now so later
+    # runs stop re-fetching and re-checking them.
+    if already_posted:
+        healed = _mark_stories_synced(airtable, already_posted, results)
+        if healed:
+            print(f"[Step 5] Marked {len(healed)} already-posted stories as synced")
 
     results.update({
         "synced_count": len(results["synced"]),
@@ -91,23 +112,145 @@ def sync_to_social(job_id: str = None) -> Dict[str, Any]:
     return results
 
 
+def _build_social_post(story: Dict[str, Any], created_at: str) -> Optional[Dict[str, Any]]:
+    """
+    Build a P5 Social Posts record from a Decoration record.
+
+    Args:
+        story: Decoration record fields
+        created_at: Timestamp shared by every post in the run
+
+    Returns:
+        Social post fields, or None if the story has no headline or bullets
+    """
+    get = story.get
+    headline = get('ai_headline', '')
+    b1 = get('ai_bullet_1', '')
+    b2 = get('ai_bullet_2', '')
+    b3 = get('ai_bullet_3', '')
+    if not headline or not (b1 or b2 or b3):
+        return None
+
+    return {
+        "source_record_id": get('storyID'),
+        "headline": headline,
+        "label": _get_label_for_slot(get('slot_order', 1)),
+        "b1": _clean_html(b1),
+        "b2": _clean_html(b2),
+        "b3": _clean_html(b3),
+        "image_raw_url": get('image_url', ''),
+        "publish_status": "ready",
+        "order": get('slot_order', 99),
+        "created_at": created_at,
+    }
+
+
+def _create_social_posts(
+    airtable: AirtableClient,
+    batch: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    results: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Create social posts for a batch in one request, falling back to
+    per-story creates if the batch fails.
+
+    A rejected batch (4xx) wrote nothing, so every story is retried. Any
+    other failure may come after the batch was written, so stories whose
+    post now exists are counted as created and only the rest are retried;
+    a duplicate post would be published twice.
+
+    Returns:
+        Stories whose social post was created
+    """
+    try:
+        airtable.create_social_posts([social_post for _, social_post in batch])
+        return [story for story, _ in batch]
+    except Exception as e:
+        error = e
+
+    created = []
+    if _is_client_error(error):
+        print(f"[Step 5] Batch create rejected ({error}), retrying stories individually")
+    else:
+        print(f"[Step 5] Batch create failed ({error}), checking which posts were written")
+        try:
+            existing = airtable.get_existing_social_post_ids([story.get('storyID') for story, _ in batch])
+        except Exception as e:
+            for story, _ in batch:
+                results["errors"].append({
+                    "story_id": story.get('storyID'),
+                    "error": f"{error} (post check failed: {e})",
+                })
+            return []
+        created = [story for story, _ in batch if story.get('storyID') in existing]
+        batch = [(story, post) for story, post in batch if story.get('storyID') not in existing]
+
+    for story, social_post in batch:
+        try:
+            airtable.create_social_post(social_post)
+            created.append(story)
+        except Exception as e:
+            results["errors"].append({
+                "story_id": story.get('storyID'),
+                "error": str(e),
+            })
+    return created
+
+
+def _mark_stories_synced(
+    airtable: AirtableClient,
+    stories: List[Dict[str, Any]],
+    results: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Mark Decoration records as synced in one request, falling back to
+    per-record updates if the batch fails.
+
+    Returns:
+        Stories successfully marked as synced
+    """
+    if not stories:
+        return []
+
+    try:
+        airtable.update_social_status_by_record_ids([story['id'] for story in stories], "synced")
+        return stories
+    except Exception as e:
+        print(f"[Step 5] Batch status update failed ({e}), retrying stories individually")
+
+    synced = []
+    for story in stories:
+        try:
+            airtable.update_social_status_by_record_ids([story['id']], "synced")
+            synced.append(story)
+        except Exception as e:
+            results["errors"].append({
+                "story_id": story.get('storyID'),
+                "error": str(e),
+            })
+    return synced
+
+
+def _record_synced(results: Dict[str, Any], stories: List[Dict[str, Any]]) -> None:
+    """Add synced stories to the job results."""
+    for story in stories:
+        results["synced"].append({
+            "story_id": story.get('storyID'),
+            "headline": story.get('ai_headline', '')[:50],
+        })
+
+
 def _get_label_for_slot(slot_order: int) -> str:
     """Get topic label for a slot number."""
-    labels = {
-        1: "Impact",
-        2: "Big Tech",
-        3: "Industry",
-        4: "Emerging",
-        5: "Human Interest",
-    }
-    return labels.get(slot_order, "News")
+    return SLOT_LABELS.get(slot_order, "News")
 
 
 def _clean_html(text: str) -> str:
     """Remove HTML tags from text for social posts."""
-    import re
-    # Remove markdown bold
-    text = re.sub(r'\*\*(.*?)\*\*', r'\1', text)
+    # Remove markdown bold (plain bullets skip the regex entirely)
+    if '**' in text:
+        text = _MARKDOWN_BOLD_RE.sub(r'\1', text)
     # Remove any HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
     return text.strip()
@@ -12,8 +12,11 @@ Tests connectivity to all required external services:
 Run with: python test_apis.py
 """
 
+import io
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -171,20 +174,58 @@ def test_mautic():
         return False
 
 
+class _ThreadStdout:
+    """Route print() from worker threads into a per-thread buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return getattr(self.local, 'buffer', self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _run_buffered(stdout: _ThreadStdout, test):
+    """Run a test, returning (passed, captured output)."""
+    stdout.local.buffer = io.StringIO()
+    try:
+        return test(), stdout.local.buffer.getvalue()
+    finally:
+        del stdout.local.buffer
+
+
 def main():
     """Run all API tests."""
     print("=" * 50)
     print("AI Editor 2.0 - API Connection Tests")
     print("=" * 50)
 
-    results = {
-        "Anthropic Claude": test_anthropic(),
-        "OpenAI": test_openai(),
-        "Google Gemini": test_gemini(),
-        "Airtable": test_airtable(),
-        "Mautic": test_mautic(),
+    tests = {
+        "Anthropic Claude": test_anthropic,
+        "OpenAI": test_openai,
+        "Google Gemini": test_gemini,
+        "Airtable": test_airtable,
+        "Mautic": test_mautic,
     }
 
+    # Each test is a remote round trip; run them concurrently and print
+    # each test's output as one block, in the order above
+    stdout = _ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+            futures = {name: pool.submit(_run_buffered, stdout, test) for name, test in tests.items()}
+            results = {}
+            for name, future in futures.items():
+                passed, output = future.result()
+                stdout.stream.write(output)
+                results[name] = passed
+    finally:
+        sys.stdout = stdout.stream
+
     print("\n" + "=" * 50)
     print("SUMMARY")
     print("=" * 50)
@@ -0,0 +1,13 @@
+"""
+Shared test setup.
+
+Tests import the workers as the `workers` package, the same way the jobs'
+relative imports resolve. AirtableClient needs an API key to construct; no
+test sends a request.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+os.environ.setdefault('AIRTABLE_API_KEY', 'test-key')
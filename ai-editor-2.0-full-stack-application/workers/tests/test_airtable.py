@@ -0,0 +1,225 @@
+"""
+Tests for the Airtable client's write and retry rules.
+
+These decide whether a failed write is retried, dropped or left alone, so a
+mistake here duplicates records rather than failing loudly.
+"""
+
+import pytest
+import requests
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+    ResponseError,
+)
+
+from workers.utils.airtable import (
+    AirtableClient,
+    WriteBuffer,
+    _is_client_error,
+    _is_unsent_error,
+)
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+def _connect_error() -> requests.ConnectionError:
+    return requests.ConnectionError(MaxRetryError(None, '/v0/app', NewConnectionError(None, 'refused')))
+
+
+class FakeTable:
+    """batch_create stand-in that fails chunks containing a marked record."""
+
+    def __init__(self, errors=None):
+        self.errors = errors or {}
+        self.rows = []
+        self.calls = 0
+
+    def batch_create(self, chunk):
+        self.calls += 1
+        for record in chunk:
+            error = self.errors.get(record['n'])
+            if error is not None:
+                raise error
+        created = [{'id': f"rec{len(self.rows) + i}", 'fields': r} for i, r in enumerate(chunk)]
+        self.rows.extend(created)
+        return created
+
+
+@pytest.fixture
+def client():
+    return AirtableClient()
+
+
+def _buffer(client, table, flush_size=50):
+    return WriteBuffer(lambda records: client._batch_write_chunks(table.batch_create, records), flush_size)
+
+
+# === Error classification ===
+
+@pytest.mark.parametrize('status, expected', [(400, True), (422, True), (429, False), (500, False), (503, False)])
+def test_is_client_error(status, expected):
+    assert _is_client_error(_http_error(status)) is expected
+
+
+@pytest.mark.parametrize('error, expected', [
+    (_http_error(429), True),
+    (requests.exceptions.RetryError(MaxRetryError(None, '/v0/app', ResponseError('too many 429s'))), True),
+    (_connect_error(), True),
+    (requests.ConnectTimeout(MaxRetryError(None, '/v0/app', ConnectTimeoutError('timed out'))), True),
+    (_http_error(422), False),
+    (_http_error(502), False),
+    (_http_error(504), False),
+    (requests.ReadTimeout('read timed out'), False),
+    (requests.ConnectionError(ProtocolError('Connection aborted')), False),
+])
+def test_is_unsent_error(error, expected):
+    assert _is_unsent_error(error) is expected
+
+
+# === Batch writes ===
+
+def test_batch_write_chunks_reports_each_chunk(client):
+    table = FakeTable({15: _http_error(422)})
+    records = [{'n': i} for i in range(30)]
+
+    written, failed = client._batch_write_chunks(table.batch_create, records)
+
+    assert [r['fields']['n'] for r in written] == list(range(10)) + list(range(20, 30))
+    assert len(failed) == 1
+    chunk, error = failed[0]
+    assert [r['n'] for r in chunk] == list(range(10, 20))
+    assert _is_client_error(error)
+
+
+def test_batch_write_raises_first_chunk_error(client):
+    table = FakeTable({3: _http_error(422)})
+    with pytest.raises(requests.HTTPError):
+        client._batch_write(table.batch_create, [{'n': i} for i in range(5)])
+
+
+# === WriteBuffer requeue rules ===
+
+def test_write_buffer_flushes_at_flush_size(client):
+    table = FakeTable()
+    buf = _buffer(client, table, flush_size=20)
+
+    buf.extend({'n': i} for i in range(19))
+    assert table.calls == 0
+
+    buf.add({'n': 19})
+    assert len(buf) == 0
+    assert len(buf.written) == 20
+
+
+def test_write_buffer_requeues_only_unsent_chunks(client):
+    table = FakeTable({5: _connect_error()})
+    buf = _buffer(client, table)
+
+    with pytest.raises(requests.ConnectionError):
+        buf.extend({'n': i} for i in range(50))
+
+    # Four chunks landed; only the refused one waits for the next flush
+    assert len(buf.written) == 40
+    assert [r['n'] for r in buf._pending] == list(range(10))
+    assert buf.rejected == []
+
+    table.errors.clear()
+    buf.flush()
+    assert sorted(r['fields']['n'] for r in table.rows) == list(range(50))
+    assert len(buf.written) == 50
+
+
+@pytest.mark.parametrize('error', [
+    _http_error(422),
+    _http_error(503),
+    requests.ReadTimeout('read timed out'),
+    requests.ConnectionError(ProtocolError('Connection aborted')),
+])
+def test_write_buffer_never_resends_rejected_or_ambiguous_chunks(client, error):
+    table = FakeTable({25: error})
+    buf = _buffer(client, table)
+
+    with pytest.raises(type(error)):
+        buf.extend({'n': i} for i in range(50))
+
+    assert len(buf) == 0
+    assert [[r['n'] for r in chunk] for chunk, _ in buf.rejected] == [list(range(20, 30))]
+
+    # Later flushes don't resend the dropped chunk or the ones that landed
+    buf.extend({'n': i} for i in range(50, 60))
+    buf.flush()
+    created = [r['fields']['n'] for r in table.rows]
+    assert len(created) == len(set(created)) == 50
+    assert len(buf.written) == 50
+
+
+def test_write_buffer_context_manager_flushes_on_exit(client):
+    table = FakeTable()
+    with _buffer(client, table) as buf:
+        buf.add({'n': 1})
+    assert buf.written_ids == ['rec0']
+
+
+# === HTTP retry rules ===
+
+@pytest.fixture
+def retry():
+    return AirtableClient._build_http_adapter().max_retries
+
+
+@pytest.mark.parametrize('method, status, expected', [
+    ('GET', 429, True),
+    ('GET', 503, True),
+    ('GET', 500, False),
+    ('POST', 429, True),
+    ('PATCH', 429, True),
+    ('POST', 502, False),
+    ('POST', 503, False),
+    ('PATCH', 504, False),
+])
+def test_retry_statuses_by_method(retry, method, status, expected):
+    assert retry.is_retry(method, status) is expected
+
+
+@pytest.mark.parametrize('method', ['GET', 'POST', 'PATCH'])
+def test_connect_errors_retry_for_every_method(retry, method):
+    retried = retry.increment(method, '/v0/app', error=ConnectTimeoutError('timed out'))
+    assert retried.total == retry.total - 1
+
+
+@pytest.mark.parametrize('error', [ReadTimeoutError(None, '/v0/app', 'read timed out'), ProtocolError('aborted')])
+def test_read_errors_retry_reads_only(retry, error):
+    assert retry.increment('GET', '/v0/app', error=error).total == retry.total - 1
+    for method in ('POST', 'PATCH'):
+        with pytest.raises(type(error)):
+            retry.increment(method, '/v0/app', error=error)
+
+
+# === Lookup chunking ===
+
+def test_chunk_lookup_values_caps_count(client):
+    values = [f"rec{i:05d}" for i in range(AirtableClient.LOOKUP_CHUNK_SIZE * 2 + 1)]
+    chunks = client._chunk_lookup_values(values)
+    assert [len(c) for c in chunks] == [AirtableClient.LOOKUP_CHUNK_SIZE] * 2 + [1]
+    assert [v for c in chunks for v in c] == values
+
+
+def test_chunk_lookup_values_caps_characters(client):
+    size = AirtableClient.LOOKUP_CHUNK_MAX_CHARS // 4
+    values = ['x' * size for _ in range(6)]
+    chunks = client._chunk_lookup_values(values)
+    assert all(sum(len(v) + 1 for v in c) <= AirtableClient.LOOKUP_CHUNK_MAX_CHARS for c in chunks)
+    assert [v for c in chunks for v in c] == values
+
+
+def test_chunk_lookup_values_oversized_value_gets_own_chunk(client):
+    huge = 'y' * (AirtableClient.LOOKUP_CHUNK_MAX_CHARS + 10)
+    assert client._chunk_lookup_values(['a', huge, 'b']) == [['a'], [huge], ['b']]
@@ -0,0 +1,41 @@
+"""Tests for incremental decoding of streamed Gemini batch responses."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('google.generativeai')
+
+from workers.utils.gemini import GeminiClient  # noqa: E402
+
+
+def _stream(text: str, size: int):
+    return [SimpleNamespace(text=text[i:i + size]) for i in range(0, len(text), size)]
+
+
+@pytest.fixture
+def gemini():
+    # _stream_batch_matches doesn't touch the models, so skip __init__
+    return GeminiClient.__new__(GeminiClient)
+
+
+@pytest.mark.parametrize('size', [1, 7, 1000])
+def test_decodes_matches_across_chunk_boundaries(gemini, size):
+    text = '{"matches": [{"story_id": "rec1", "headline": "A, [b]"}, {"story_id": "rec2", "headline": "C"}]}'
+    matches, full_text = gemini._stream_batch_matches(_stream(text, size))
+    assert matches == [
+        {"story_id": "rec1", "headline": "A, [b]"},
+        {"story_id": "rec2", "headline": "C"},
+    ]
+    assert full_text == text
+
+
+def test_truncated_response_keeps_finished_matches(gemini):
+    text = '{"matches": [{"story_id": "rec1", "headline": "A"}, {"story_id": "rec2", "head'
+    matches, _ = gemini._stream_batch_matches(_stream(text, 5))
+    assert matches == [{"story_id": "rec1", "headline": "A"}]
+
+
+def test_empty_and_missing_matches(gemini):
+    assert gemini._stream_batch_matches(_stream('{"matches": []}', 3))[0] == []
+    assert gemini._stream_batch_matches(_stream('{"error": "quota"}', 3))[0] is None
@@ -0,0 +1,56 @@
+"""Tests for the pre-filter's client-side freshness rules."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip('google.generativeai')
+
+from workers.jobs.prefilter import (  # noqa: E402
+    _SLOTS_BY_MASK,
+    _UNKNOWN_AGE_MASK,
+    _calculate_eligible_slots,
+    _calculate_hours_ago,
+    _slot_mask,
+)
+
+NOW = datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize('hours_ago, slots', [
+    (0, (1, 2, 3, 4, 5)),
+    (24, (1, 2, 3, 4, 5)),
+    (25, (2, 3, 4, 5)),
+    (48, (2, 3, 4, 5)),
+    (49, (3, 5)),
+    (168, (3, 5)),
+    (169, ()),
+])
+def test_eligible_slots_by_age(hours_ago, slots):
+    assert _SLOTS_BY_MASK[_calculate_eligible_slots(hours_ago)] == slots
+
+
+def test_slot_mask_round_trips():
+    for slots in [(), (1,), (2, 4), (1, 2, 3, 4, 5)]:
+        assert _SLOTS_BY_MASK[_slot_mask(slots)] == slots
+
+
+def test_gemini_slots_are_intersected_with_freshness():
+    # Gemini said 1, 3 and 5 (with a repeat); a 30h-old story can't be slot 1
+    gemini = _slot_mask([1, 3, 3, 5])
+    assert _SLOTS_BY_MASK[gemini & _calculate_eligible_slots(30)] == (3, 5)
+
+
+@pytest.mark.parametrize('date_str, hours', [
+    ('2025-01-15T08:00:00.000Z', 4),
+    ('2025-01-15T08:00:00+00:00', 4),
+    ('2025-01-14', 36),
+])
+def test_hours_ago(date_str, hours):
+    assert _calculate_hours_ago(date_str, NOW) == hours
+
+
+@pytest.mark.parametrize('date_str', [None, '', 'yesterday', 12345])
+def test_unknown_dates_are_not_treated_as_old(date_str):
+    assert _calculate_hours_ago(date_str, NOW) is None
+    assert _SLOTS_BY_MASK[_UNKNOWN_AGE_MASK] == (1, 2, 3, 4, 5)
@@ -0,0 +1,98 @@
+"""
+Tests for slot selection's speculative run: all five slots pick in parallel
+against the initial state, then commit in slot order, re-running any pick
+that collides with an earlier slot.
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip('psycopg2')
+
+from workers.jobs import slot_selection  # noqa: E402
+
+
+def _story(story_id, company='', source='src'):
+    return {'storyID': story_id, 'headline': story_id, 'company': company, 'source_id': source}
+
+
+class FakeAirtable:
+    def __init__(self, candidates_by_slot):
+        self.candidates_by_slot = candidates_by_slot
+        self.created = None
+
+    def get_prefilter_candidates_by_slot(self, date=None):
+        return {slot: self.candidates_by_slot.get(slot, []) for slot in range(1, 6)}
+
+    def get_yesterday_selected_stories(self):
+        return []
+
+    def create_selected_slots(self, data):
+        self.created = data
+
+
+@pytest.fixture
+def run(monkeypatch):
+    """Run select_slots with Claude replaced by 'first allowed candidate'."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_select(client, slot_num, candidates_by_id, selected_companies, **kwargs):
+        with lock:
+            calls.append(slot_num)
+        for story in candidates_by_id.values():
+            if story.get('company') not in selected_companies:
+                return story
+        return None
+
+    def select(candidates_by_slot):
+        airtable = FakeAirtable(candidates_by_slot)
+        monkeypatch.setattr(slot_selection, 'get_airtable_client', lambda: airtable)
+        monkeypatch.setattr(slot_selection.anthropic, 'Anthropic', lambda **kwargs: None)
+        monkeypatch.setattr(slot_selection, '_select_story_for_slot', fake_select)
+        monkeypatch.setattr(slot_selection, '_generate_subject_line', lambda **kwargs: 'Subject')
+        results = slot_selection.select_slots()
+        picks = {slot: data['storyId'] for slot, data in results['slots'].items()}
+        return picks, sorted(calls), results
+
+    return select
+
+
+def test_no_collisions_means_one_call_per_slot(run):
+    picks, calls, _ = run({slot: [_story(f"rec{slot}", source=f"src{slot}")] for slot in range(1, 6)})
+    assert picks == {slot: f"rec{slot}" for slot in range(1, 6)}
+    assert calls == [1, 2, 3, 4, 5]
+
+
+def test_same_story_is_rerun_for_the_later_slot(run):
+    picks, calls, _ = run({
+        1: [_story('recA', source='s1')],
+        2: [_story('recA', source='s1'), _story('recB', source='s2')],
+    })
+    assert picks == {1: 'recA', 2: 'recB'}
+    assert calls == [1, 2, 2]
+
+
+def test_same_company_is_rerun_for_the_later_slot(run):
+    picks, calls, _ = run({
+        1: [_story('recA', company='OpenAI', source='s1')],
+        2: [_story('recC', company='OpenAI', source='s2'), _story('recD', company='Meta', source='s3')],
+    })
+    assert picks == {1: 'recA', 2: 'recD'}
+    assert calls == [1, 2, 2]
+
+
+def test_source_cap_is_enforced_on_commit(run):
+    cap = slot_selection.MAX_STORIES_PER_SOURCE
+    candidates = {slot: [_story(f"rec{slot}", source='busy')] for slot in range(1, cap + 1)}
+    candidates[cap + 1] = [_story('recBusy', source='busy'), _story('recOther', source='quiet')]
+    picks, _, _ = run(candidates)
+    assert picks[cap + 1] == 'recOther'
+    assert list(picks.values()).count('recBusy') == 0
+
+
+def test_slot_without_candidates_is_reported(run):
+    picks, _, results = run({1: [_story('recA')]})
+    assert picks == {1: 'recA'}
+    assert {e['slot'] for e in results['errors'] if 'slot' in e} == {2, 3, 4, 5}
@@ -5,6 +5,7 @@ Flask app for triggering RQ jobs from Next.js dashboard
 Endpoints:
     POST /jobs/<step_name>  - Trigger a specific pipeline step
     GET /jobs/<job_id>      - Get job status
+    POST /jobs/status       - Get status of several jobs at once
     GET /health             - Health check
 
 Environment:
@@ -12,11 +13,15 @@ Environment:
     TRIGGER_SECRET: Shared secret for authentication (optional)
 """
 
+import hmac
 import os
 import json
 import logging
+import importlib
+import threading
+import time
 from datetime import datetime
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from redis import Redis
 from rq import Queue
 from rq.job import Job
@@ -39,9 +44,20 @@ REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379')
 TRIGGER_SECRET = os.environ.get('TRIGGER_SECRET', '')
 
 
+_redis = None
+
+
 def get_redis_connection():
-    """Get Redis connection from URL"""
-    return Redis.from_url(REDIS_URL)
+    """
+    Get the shared Redis connection.
+
+    Built once per process; the client's connection pool is thread-safe, so
+    every request handler reuses it instead of opening new sockets.
+    """
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(REDIS_URL)
+    return _redis
 
 
 def verify_auth():
@@ -52,64 +68,51 @@ def verify_auth():
     auth_header = request.headers.get('Authorization', '')
     if auth_header.startswith('Bearer '):
         token = auth_header[7:]
-        return token == TRIGGER_SECRET
+        # Constant-time comparison so response timing can't leak the secret
+        return hmac.compare_digest(token.encode(), TRIGGER_SECRET.encode())
     return False
 
 
-# Job function mapping
-JOB_FUNCTIONS = {}
+# Job function specs: step name -> "module:function"
+_SPECS = {
+    'ingest': 'jobs.ingest:ingest_articles',
+    'ai_scoring': 'jobs.ai_scoring:run_ai_scoring',
+    'prefilter': 'jobs.prefilter:prefilter_stories',
+    'slot_selection': 'jobs.slot_selection:select_slots',
+    'decoration': 'jobs.decoration:decorate_story',
+    'images': 'jobs.image_generation:generate_image',
+    'html_compile': 'jobs.html_compile:compile_newsletter_html',
+    'mautic_send': 'jobs.mautic_send:send_via_mautic',
+    'social_sync': 'jobs.social_sync:sync_to_social',
+    # Sandbox jobs (FreshRSS migration)
+    'ingest_sandbox': 'jobs.ingest_sandbox:ingest_articles_sandbox',
+    'ai_scoring_sandbox': 'jobs.ai_scoring_sandbox:run_ai_scoring_sandbox',
+}
 
 
-def get_job_function(step_name: str):
+def _load_job_functions() -> dict:
     """
-    Lazy load job functions to avoid import errors at startup.
-    Maps step names to their handler functions.
+    Resolve every job function once at startup.
+    A job that fails to import is logged and left out, so one broken
+    module doesn't take the trigger service down.
     """
-    if step_name in JOB_FUNCTIONS:
-        return JOB_FUNCTIONS[step_name]
+    functions = {}
+    for step_name, spec in _SPECS.items():
+        module_name, attr = spec.split(':')
+        try:
+            functions[step_name] = getattr(importlib.import_module(module_name), attr)
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Failed to import job function for {step_name}: {e}")
+    return functions
 
-    try:
-        if step_name == 'ingest':
-            from jobs.ingest import ingest_articles
-            JOB_FUNCTIONS[step_name] = ingest_articles
-        elif step_name == 'ai_scoring':
-            from jobs.ai_scoring import run_ai_scoring
-            JOB_FUNCTIONS[step_name] = run_ai_scoring
-        elif step_name == 'prefilter':
-            from jobs.prefilter import prefilter_stories
-            JOB_FUNCTIONS[step_name] = prefilter_stories
-        elif step_name == 'slot_selection':
-            from jobs.slot_selection import select_slots
-            JOB_FUNCTIONS[step_name] = select_slots
-        elif step_name == 'decoration':
-            from jobs.decoration import decorate_stories
-            JOB_FUNCTIONS[step_name] = decorate_stories
-        elif step_name == 'images':
-            from jobs.image_generation import generate_images
-            JOB_FUNCTIONS[step_name] = generate_images
-        elif step_name == 'html_compile':
-            from jobs.html_compile import compile_html
-            JOB_FUNCTIONS[step_name] = compile_html
-        elif step_name == 'mautic_send':
-            from jobs.mautic_send import send_via_mautic
-            JOB_FUNCTIONS[step_name] = send_via_mautic
-        elif step_name == 'social_sync':
-            from jobs.social_sync import sync_social_posts
-            JOB_FUNCTIONS[step_name] = sync_social_posts
-        # Sandbox jobs (FreshRSS migration)
-        elif step_name == 'ingest_sandbox':
-            from jobs.ingest_sandbox import ingest_articles_sandbox
-            JOB_FUNCTIONS[step_name] = ingest_articles_sandbox
-        elif step_name == 'ai_scoring_sandbox':
-            from jobs.ai_scoring_sandbox import run_ai_scoring_sandbox
-            JOB_FUNCTIONS[step_name] = run_ai_scoring_sandbox
-        else:
-            return None
-
-        return JOB_FUNCTIONS.get(step_name)
-    except ImportError as e:
-        logger.error(f"Failed to import job function for {step_name}: {e}")
-        return None
+
+# Job function mapping
+JOB_FUNCTIONS = _load_job_functions()
+
+
+def get_job_function(step_name: str):
+    """Get the handler function for a step name, or None if unavailable."""
+    return JOB_FUNCTIONS.get(step_name)
 
 
 # Queue name mapping (matches worker.py priority)
@@ -128,23 +131,50 @@ QUEUE_MAPPING = {
     'ai_scoring_sandbox': 'default',
 }
 
+# One Queue object per priority, built once (no Redis I/O until used)
+QUEUES = {
+    name: Queue(name, connection=get_redis_connection())
+    for name in ('high', 'default', 'low')
+}
+
+
+# Redis ping result is reused for this long so probe storms don't hit Redis
+HEALTH_CACHE_TTL = 1.0
+_health_cache = {'checked_at': 0.0, 'redis': None}
+_health_lock = threading.Lock()
+
+
+def _redis_status() -> str:
+    """Ping Redis at most once per HEALTH_CACHE_TTL and return its status"""
+    with _health_lock:
+        if time.monotonic() - _health_cache['checked_at'] < HEALTH_CACHE_TTL:
+            return _health_cache['redis']
+
+        try:
+            get_redis_connection().ping()
+            redis_status = 'connected'
+        except Exception as e:
+            redis_status = f'error: {str(e)}'
+
+        _health_cache['redis'] = redis_status
+        _health_cache['checked_at'] = time.monotonic()
+        return redis_status
+
+
+# Static part of the health response, serialized once
+_HEALTH_BODY = '{"available_jobs": %s, "redis": %%s, "status": "ok", "timestamp": %%s}' % (
+    json.dumps(list(QUEUE_MAPPING.keys())).replace('%', '%%')
+)
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Health check endpoint"""
-    try:
-        conn = get_redis_connection()
-        conn.ping()
-        redis_status = 'connected'
-    except Exception as e:
-        redis_status = f'error: {str(e)}'
-
-    return jsonify({
-        'status': 'ok',
-        'timestamp': datetime.utcnow().isoformat(),
-        'redis': redis_status,
-        'available_jobs': list(QUEUE_MAPPING.keys())
-    })
+    """Health check endpoint (unauthenticated)"""
+    body = _HEALTH_BODY % (
+        json.dumps(_redis_status()),
+        json.dumps(datetime.utcnow().isoformat()),
+    )
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/jobs/<step_name>', methods=['POST'])
@@ -199,10 +229,9 @@ def trigger_job(step_name: str):
     params = request.get_json() or {}
 
     try:
-        # Connect to Redis and enqueue job
-        conn = get_redis_connection()
+        # Enqueue on the step's priority queue
         queue_name = QUEUE_MAPPING[step_name]
-        queue = Queue(queue_name, connection=conn)
+        queue = QUEUES[queue_name]
 
         # Enqueue the job with optional parameters
         job = queue.enqueue(
@@ -248,27 +277,67 @@ def get_job_status(job_id: str):
         conn = get_redis_connection()
         job = Job.fetch(job_id, connection=conn)
 
-        response = {
+        return jsonify(_job_status_payload(job))
+
+    except Exception as e:
+        return jsonify({
             'job_id': job_id,
-            'status': job.get_status(),
-            'created_at': job.created_at.isoformat() if job.created_at else None,
-            'started_at': job.started_at.isoformat() if job.started_at else None,
-            'ended_at': job.ended_at.isoformat() if job.ended_at else None,
+            'status': 'not_found',
+            'error': str(e)
+        }), 404
+
+
+@app.route('/jobs/status', methods=['POST'])
+def get_jobs_status():
+    """
+    Get status of several jobs in one Redis round trip.
+
+    Request Body:
+        {"ids": ["abc123", "def456"]}
+
+    Returns:
+        {
+            "jobs": [{...same fields as GET /jobs/status/<job_id>...}],
+            "not_found": ["def456"]
         }
+    """
+    ids = (request.get_json(silent=True) or {}).get('ids')
+    if not isinstance(ids, list) or not all(isinstance(job_id, str) for job_id in ids):
+        return jsonify({
+            'error': 'Request body must be {"ids": [<job_id>, ...]}'
+        }), 400
 
-        if job.is_finished:
-            response['result'] = job.result
-        elif job.is_failed:
-            response['error'] = str(job.exc_info) if job.exc_info else 'Unknown error'
+    try:
+        jobs = Job.fetch_many(ids, connection=get_redis_connection())
 
-        return jsonify(response)
+        return jsonify({
+            'jobs': [_job_status_payload(job, refresh=False) for job in jobs if job],
+            'not_found': [job_id for job_id, job in zip(ids, jobs) if not job],
+        })
 
     except Exception as e:
         return jsonify({
-            'job_id': job_id,
-            'status': 'not_found',
             'error': str(e)
-        }), 404
+        }), 500
+
+
+def _job_status_payload(job: Job, refresh: bool = True) -> dict:
+    """Build the status response for a job (refresh=False reuses loaded state)"""
+    status = job.get_status(refresh=refresh)
+    response = {
+        'job_id': job.id,
+        'status': status,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'ended_at': job.ended_at.isoformat() if job.ended_at else None,
+    }
+
+    if status == 'finished':
+        response['result'] = job.result
+    elif status == 'failed':
+        response['error'] = str(job.exc_info) if job.exc_info else 'Unknown error'
+
+    return response
 
 
 @app.route('/jobs/queue', methods=['GET'])
@@ -287,22 +356,37 @@ def get_queue_status():
     """
     try:
         conn = get_redis_connection()
-        queues = {}
 
-        for queue_name in ['high', 'default', 'low']:
-            queue = Queue(queue_name, connection=conn)
+        # Counts and the first 10 job IDs of every queue in one round trip
+        with conn.pipeline(transaction=False) as pipe:
+            for queue in QUEUES.values():
+                pipe.llen(queue.key)
+                pipe.lrange(queue.key, 0, 9)  # Limit to 10 jobs per queue
+            replies = pipe.execute()
+
+        counts = replies[0::2]
+        job_ids = [[job_id.decode() for job_id in ids] for ids in replies[1::2]]
+
+        # Hydrate all listed jobs in one batched fetch
+        fetched = iter(Job.fetch_many([job_id for ids in job_ids for job_id in ids], connection=conn))
+
+        queues = {}
+        for queue_name, count, ids in zip(QUEUES, counts, job_ids):
             jobs = []
 
-            for job in queue.jobs[:10]:  # Limit to 10 jobs per queue
+            for job in (next(fetched) for _ in ids):
+                if job is None:  # Expired or deleted since LRANGE
+                    continue
                 jobs.append({
                     'id': job.id,
                     'func_name': job.func_name,
-                    'status': job.get_status(),
+                    # Status was loaded by fetch_many; skip the per-job HGET
+                    'status': job.get_status(refresh=False),
                     'created_at': job.created_at.isoformat() if job.created_at else None
                 })
 
             queues[queue_name] = {
-                'count': len(queue),
+                'count': count,
                 'jobs': jobs
             }
 
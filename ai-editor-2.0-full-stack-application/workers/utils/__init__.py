@@ -1,7 +1,35 @@
 """
 AI Editor 2.0 - Utility modules
+
+Clients are resolved lazily (PEP 562) so importing a light submodule such as
+utils.rate_limit or utils.pivot_id doesn't pull in the API SDKs.
 """
 
-from .airtable import AirtableClient
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'AirtableClient': '.airtable',
+    'get_airtable_client': '.airtable',
+    'ClaudeClient': '.claude',
+    'GeminiClient': '.gemini',
+    'DatabaseClient': '.db',
+    'get_db': '.db',
+    'get_prompt': '.prompts',
+    'preload_all_prompts': '.prompts',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ['AirtableClient']
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,345 @@ Airtable Client for AI Editor 2.0
 Wraps pyairtable for accessing Pivot Media Airtable bases.
 """
 
+import logging
 import os
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterator, List, Optional, Set, Tuple
+import orjson
 from pyairtable import Api, Table
+from pyairtable.formulas import field_name, quoted
+from redis import Redis
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, RetryError
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.retry import Retry
+
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality story fields repeated across hundreds of records
+_INTERNED_STORY_FIELDS = ('source_id', 'topic', 'newsletter')
+
+# Formula templates, formatted per call (see AirtableClient._field_equals
+# and _field_in_formula for per-value lookups). String values are passed
+# in already quoted with pyairtable.formulas.quoted().
+_PREFILTER_DATE_FORMULA = "{{date_prefiltered}} = {date}"
+_PREFILTER_SLOT_DATE_FORMULA = "AND({{slot}} = {slot}, {{date_prefiltered}} = {date})"
+_PREFILTER_SLOTS_DATE_FORMULA = "AND(OR({slots}), {{date_prefiltered}} = {date})"
+_ISSUE_DAY_FORMULA = "SEARCH({day}, {{issue_date}})"
+_DECORATED_FOR_DAY_FORMULA = "AND({{image_status}} = 'generated', IS_SAME({{created_at}}, {day}, 'day'))"
+_PUBLISHED_AFTER_FORMULA = "IS_AFTER({{date_og_published}}, {date})"
+_SOCIAL_SYNC_FORMULA = "AND({image_status} = 'generated', OR({social_status} = '', {social_status} = BLANK()))"
+# Newest decorations first, so stories that can never sync don't hold the
+# capped query's slots ahead of new ones
+_SOCIAL_SYNC_SORT = ['-completed_at']
+
+# Flattened Selected Slots field names: (slot, headline, storyId, pivotId)
+_SLOT_FIELD_NAMES = tuple(
+    (i, f'slot_{i}_headline', f'slot_{i}_storyId', f'slot_{i}_pivotId')
+    for i in range(1, 6)
+)
+
+# Field projections (fields=) per read. Only columns the reader uses and
+# that are known to exist: naming a missing column fails the whole request.
+# Selected Slots: the slot fields alone when only the stories are needed,
+# plus everything create_selected_slots writes
+_FIELDS_SELECTED_SLOT_STORIES = [name for slot in _SLOT_FIELD_NAMES for name in slot[1:]]
+_FIELDS_SELECTED_SLOTS = ['issue_date', 'subject_line'] + _FIELDS_SELECTED_SLOT_STORIES
+_FIELDS_SOURCE_SCORES = ['source_name', 'credibility_score']
+# Decoration fields read by the social sync job
+_FIELDS_SOCIAL_SYNC = [
+    'storyID', 'ai_headline', 'ai_bullet_1', 'ai_bullet_2', 'ai_bullet_3',
+    'image_url', 'slot_order',
+]
+_FIELDS_SOCIAL_POST_KEY = ['source_record_id']
+
+
+@lru_cache(maxsize=64)
+def _prefilter_formula(date: str, slots: Tuple[int, ...] = ()) -> str:
+    """Pre-filter Log formula for a date, optionally limited to some slots."""
+    if not slots:
+        return _PREFILTER_DATE_FORMULA.format(date=quoted(date))
+    if len(slots) == 1:
+        return _PREFILTER_SLOT_DATE_FORMULA.format(slot=int(slots[0]), date=quoted(date))
+    conditions = ", ".join(f"{{slot}} = {int(slot)}" for slot in slots)
+    return _PREFILTER_SLOTS_DATE_FORMULA.format(slots=conditions, date=quoted(date))
+
+
+def _flatten(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Turn pyairtable records into flat field dicts carrying the record 'id'.
+
+    Reuses each record's fields dict rather than copying it; as before, a
+    field literally named 'id' takes precedence over the record ID.
+    """
+    flat = []
+    for r in records:
+        fields = r['fields']
+        fields.setdefault('id', r['id'])
+        flat.append(fields)
+    return flat
+
+
+def gather(*calls: Callable[[], Any], max_workers: int = 5) -> List[Any]:
+    """
+    Run independent blocking calls (typically Airtable reads) concurrently.
+
+    Per-base pacing is handled by the session adapter, so callers can fan
+    out freely.
+
+    Args:
+        calls: Zero-argument callables
+        max_workers: Upper bound on threads
+
+    Returns:
+        Results in the same order as calls; the first exception is re-raised
+    """
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+
+# Chunks a batch write couldn't send, each with the error it failed with
+_FailedChunks = List[Tuple[List[Dict[str, Any]], Exception]]
+
+
+def _is_client_error(error: Exception) -> bool:
+    """True for an HTTP 4xx other than 429, which retrying won't fix."""
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+def _is_unsent_error(error: Exception) -> bool:
+    """
+    True when a failed write can't have been applied, so resending it is safe.
+
+    That is a 429, or a connection that was never established. Read
+    timeouts, dropped connections and 5xx can arrive after Airtable has
+    applied the write, so they return False.
+    """
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status == 429:
+        return True
+    # Writes are only retried on 429 (see _WriteSafeRetry), so running out
+    # of retries means Airtable kept refusing the request
+    if isinstance(error, RetryError):
+        return True
+    if isinstance(error, RequestsConnectionError):
+        reason = error.args[0] if error.args else None
+        reason = getattr(reason, 'reason', reason)
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+class WriteBuffer:
+    """
+    Collects records written one at a time inside a loop and sends them in
+    batches instead of one POST per record.
+
+    Use as a context manager; anything still buffered is flushed on a clean
+    exit. write sends the records in chunks and reports which chunks failed.
+    Only chunks that can't have been applied (429s, connections never made)
+    stay buffered for the next flush. Everything else moves to rejected:
+    a 4xx (e.g. 422 UNKNOWN_FIELD_NAME) will never succeed, and a timeout or
+    5xx may have been written already, so resending could duplicate it.
+    Chunks that were written are never resent.
+
+        with airtable.batched_prefilter_logs() as buf:
+            for record in records:
+                buf.add(record)
+        ids = buf.written_ids
+    """
+
+    def __init__(
+        self,
+        write: Callable[[List[Dict[str, Any]]], Tuple[List[Dict[str, Any]], _FailedChunks]],
+        flush_size: int,
+    ):
+        self._write = write
+        self._flush_size = flush_size
+        self._pending: List[Dict[str, Any]] = []
+        self.written: List[Dict[str, Any]] = []
+        # Chunks dropped rather than retried: (records, error)
+        self.rejected: _FailedChunks = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Buffer a record, flushing once flush_size records are waiting."""
+        self._pending.append(record)
+        if len(self._pending) >= self._flush_size:
+            self.flush()
+
+    def extend(self, records) -> None:
+        """Buffer several records, flushing once flush_size are waiting."""
+        self._pending.extend(records)
+        if len(self._pending) >= self._flush_size:
+            self.flush()
+
+    def flush(self) -> List[Dict[str, Any]]:
+        """
+        Write everything buffered.
+
+        Returns:
+            The records written by this flush
+
+        Raises:
+            The first chunk error, once written chunks are recorded and
+            retryable ones are back in the buffer
+        """
+        if not self._pending:
+            return []
+        records, self._pending = self._pending, []
+        try:
+            written, failed = self._write(records)
+        except Exception:
+            self._pending[:0] = records
+            raise
+        self.written.extend(written)
+
+        retry = []
+        for chunk, error in failed:
+            if _is_unsent_error(error):
+                retry.extend(chunk)
+            else:
+                logger.warning(f"Dropping {len(chunk)} records that failed and may not be "
+                               f"safe to resend: {error}")
+                self.rejected.append((chunk, error))
+        self._pending[:0] = retry
+
+        if failed:
+            raise failed[0][1]
+        return written
+
+    @property
+    def written_ids(self) -> List[str]:
+        """IDs of every record written so far, in write order."""
+        return [r['id'] for r in self.written]
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
+class _JitteredRetry(Retry):
+    """
+    urllib3 Retry with full-range jitter on the exponential backoff, capped
+    at BACKOFF_CAP seconds.
+
+    A Retry-After header (sent with Airtable's 429s) still takes precedence
+    over the computed backoff; 5xx responses and dropped connections use the
+    jittered backoff so concurrent threads don't retry in lockstep.
+    """
+
+    BACKOFF_CAP = 32.0
+
+    def get_backoff_time(self) -> float:
+        backoff = min(self.BACKOFF_CAP, super().get_backoff_time())
+        return random.uniform(backoff / 2, backoff) if backoff > 0 else 0
+
+
+class _WriteSafeRetry(_JitteredRetry):
+    """
+    Retry that only resends a request when doing so can't apply it twice.
+
+    Methods in allowed_methods (reads) get every retry. Anything else (POST
+    creates, PATCH updates) is retried only after a connect error, when the
+    request never left, or a 429, which Airtable refuses without applying.
+    Read timeouts, dropped connections and 5xx can all arrive after Airtable
+    has applied the write, so those are raised instead of duplicating records.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if self._is_method_retryable(method):
+            return super().is_retry(method, status_code, has_retry_after)
+        return status_code == 429 and status_code in (self.status_forcelist or ())
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if (
+            error is not None
+            and method is not None
+            and not self._is_method_retryable(method)
+            and not self._is_connection_error(error)
+        ):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a token from a per-base bucket before each request.
+
+    Airtable allows 5 requests/sec per base; pacing requests here keeps
+    concurrent threads under that instead of tripping 429s and backing off.
+    """
+
+    _limiters: Dict[str, RateLimiter] = {}
+    _limiters_lock = threading.Lock()
+
+    def __init__(self, requests_per_second: float, **kwargs):
+        self.requests_per_second = requests_per_second
+        super().__init__(**kwargs)
+
+    def _limiter_for(self, url: str) -> Optional[RateLimiter]:
+        # API paths look like /v0/{baseId}/{table}; meta endpoints aren't per-base
+        parts = url.split('/', 5)
+        base_id = parts[4] if len(parts) > 4 and parts[3] == 'v0' else None
+        if not base_id or not base_id.startswith('app'):
+            return None
+        with self._limiters_lock:
+            limiter = self._limiters.get(base_id)
+            if limiter is None:
+                limiter = self._limiters[base_id] = RateLimiter(self.requests_per_second)
+            return limiter
+
+    def send(self, request, **kwargs):
+        limiter = self._limiter_for(request.url)
+        started = time.perf_counter()
+        if limiter:
+            limiter.acquire()
+        sent = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception as e:
+            logger.warning(f"Airtable {request.method} {self._path(request.url)} failed after "
+                           f"{(time.perf_counter() - sent) * 1000:.0f}ms: {type(e).__name__}")
+            raise
+
+        # Per-request timing: pacing wait, round trip (including any
+        # session retries), payload size and how many retries it took
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', ())
+        if retries:
+            logger.info(f"Airtable {request.method} {self._path(request.url)} -> "
+                        f"{response.status_code} after {len(retries)} retries "
+                        f"({', '.join(str(r.status or r.error) for r in retries)})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Airtable {request.method} {self._path(request.url)} -> {response.status_code} "
+                f"wait={(sent - started) * 1000:.0f}ms "
+                f"duration={(time.perf_counter() - sent) * 1000:.0f}ms "
+                f"bytes={response.headers.get('Content-Length', '?')}"
+            )
+        return response
+
+    @staticmethod
+    def _path(url: str) -> str:
+        """URL path without the host or query string (formulas can be long)."""
+        return url.split('?', 1)[0].split('/', 3)[-1]
 
 
 class AirtableClient:
@@ -24,7 +359,14 @@ class AirtableClient:
         if not self.api_key:
             raise ValueError("AIRTABLE_API_KEY not set")
 
-        self.api = Api(self.api_key)
+        self.api = Api(self.api_key, retry_strategy=None)
+        self.api.session.mount('https://', self._build_http_adapter())
+        # Table handles by (base_id, table_id), built on first use
+        self._tables: Dict[Tuple[str, str], Table] = {}
+        # Story IDs known to have a social post (seen in a lookup or created
+        # by this client). Only hits are kept: posts aren't deleted, but a
+        # miss can be invalidated by another writer at any time.
+        self._known_social_posts: Set[str] = set()
 
         # Pivot Media Master base
         self.master_base_id = os.getenv('AIRTABLE_BASE_ID', 'appwSozYTkrsQWUXB')
@@ -44,49 +386,602 @@ class AirtableClient:
         self.social_base_id = os.getenv('P5_SOCIAL_BASE_ID', 'appRUgK44hQnXH1PM')
         self.social_posts_table_id = os.getenv('P5_SOCIAL_POSTS_TABLE', 'Social Post Input')
 
+    # Airtable's maximum records per list request
+    PAGE_SIZE = 100
+    # Values per OR() lookup formula. Kept a few under PAGE_SIZE so a chunk's
+    # matches (plus the odd duplicate row) fit in one page with no offset request
+    LOOKUP_CHUNK_SIZE = PAGE_SIZE - 5
+    # Characters of lookup values per formula. Long values (URLs, titles)
+    # close a chunk early so its GET stays well under Airtable's 16k URL
+    # limit, past which pyairtable falls back to a slower POST listRecords
+    LOOKUP_CHUNK_MAX_CHARS = 4000
+    # Concurrent lookup requests (Airtable allows 5 requests/sec per base)
+    LOOKUP_MAX_WORKERS = 5
+    # Unbounded reads returning more than this many records are logged; they
+    # cost one request per PAGE_SIZE records and usually mean a filter broke
+    RECORD_LIMIT_WARNING = 5000
+    # Check projected field names against the table schema (Meta API) before
+    # reading. Needs the schema.bases:read scope, so it's opt-in; a misspelled
+    # field otherwise fails the whole request with UNKNOWN_FIELD_NAME.
+    VALIDATE_FIELDS = os.getenv('AIRTABLE_VALIDATE_FIELDS', '0') == '1'
+    SCHEMA_TTL = 24 * 60 * 60
+    # Airtable accepts at most 10 records per create/update request
+    WRITE_BATCH_SIZE = 10
+    # Requests per second per base, Airtable's documented limit; shared by
+    # every client in the process
+    REQUESTS_PER_SECOND_PER_BASE = float(os.getenv('AIRTABLE_MAX_RPS', '5'))
+    # Pooled keep-alive connections (covers LOOKUP_MAX_WORKERS plus callers'
+    # own threads)
+    HTTP_POOL_MAXSIZE = 16
+    # Statuses retried by the session. 500 is left out since the request may
+    # have been applied; 502-504 come from Airtable's edge. Only reads are
+    # retried on 5xx; writes just on 429 and connect errors (see _WriteSafeRetry).
+    HTTP_RETRY_STATUSES = (429, 502, 503, 504)
+    HTTP_RETRY_READ_METHODS = frozenset({'GET', 'HEAD'})
+    # Retries after the first attempt, and the base of the exponential backoff
+    HTTP_RETRY_TOTAL = 5
+    HTTP_RETRY_BACKOFF = 1.0
+
+    # Cache lifetimes (seconds) for slow-changing reads
+    SOURCE_SCORES_TTL = 6 * 60 * 60
+    YESTERDAY_ISSUE_TTL = 60 * 60
+    # Today's slots can be edited from the dashboard, so keep this short
+    TODAY_SLOTS_TTL = 60
+    # Candidate buckets are shared by the slot lookups of one run; writes
+    # through this client drop them straight away
+    PREFILTER_CANDIDATES_TTL = 60
+    # Articles don't change once ingested; misses aren't cached since the
+    # article may be ingested later
+    ARTICLE_TTL = 10 * 60
+    ARTICLE_CACHE_MAXSIZE = 2048
+    # Reads cached with shared=True are also kept in Redis under this prefix,
+    # since RQ runs every job in a fresh fork with an empty process cache
+    SHARED_CACHE_PREFIX = "p5:airtable:"
+
+    # Process-wide read cache shared by all clients: key -> (expires_at, value)
+    _cache: Dict[Any, Tuple[float, Any]] = {}
+    _cache_lock = threading.Lock()
+    _cache_key_locks: Dict[Any, threading.Lock] = {}
+    # Found articles, least recently used first: pivot_Id -> (expires_at, fields)
+    _articles: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+    # Uncached reads currently running: key -> Future shared with late callers
+    _inflight: Dict[Any, Future] = {}
+    _redis: Optional[Redis] = None
+
+    @classmethod
+    def _build_http_adapter(cls) -> HTTPAdapter:
+        """
+        HTTP adapter for the Airtable session: per-base request pacing, a
+        connection pool large enough for the concurrent lookup/write threads
+        so TLS connections are kept alive and reused, plus retries that
+        honour Retry-After.
+
+        Reads ride out 429s, edge 5xx and dropped connections. Creates and
+        updates are retried only where they can't have been applied (429s
+        and connect errors), so a retry never writes a record twice.
+        """
+        retry = _WriteSafeRetry(
+            total=cls.HTTP_RETRY_TOTAL,
+            status_forcelist=cls.HTTP_RETRY_STATUSES,
+            backoff_factor=cls.HTTP_RETRY_BACKOFF,
+            allowed_methods=cls.HTTP_RETRY_READ_METHODS,
+            respect_retry_after_header=True,
+        )
+        return _RateLimitedAdapter(
+            cls.REQUESTS_PER_SECOND_PER_BASE,
+            pool_connections=4,
+            pool_maxsize=cls.HTTP_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+
     def _get_table(self, base_id: str, table_id: str) -> Table:
-        """Get a table instance."""
-        return self.api.table(base_id, table_id)
+        """Get a table instance, reusing it across calls."""
+        key = (base_id, table_id)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = self.api.table(base_id, table_id)
+        return table
+
+    def _cached(self, key: Any, ttl: float, loader: Callable[[], Any], shared: bool = False) -> Any:
+        """
+        Return a cached value, loading it if missing or expired.
+
+        A per-key lock ensures concurrent callers trigger a single load.
+
+        Args:
+            key: Cache key (a string or a tuple of strings/ints)
+            ttl: Seconds the value stays fresh
+            loader: Zero-argument callable fetching the value from Airtable
+            shared: Also keep the (JSON-serialisable) value in Redis so other
+                job runs reuse it; Redis errors fall back to the loader
+        """
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        with self._cache_lock:
+            key_lock = self._cache_key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            entry = self._cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = self._shared_cache_get(key) if shared else None
+            if value is None:
+                value = loader()
+                if shared:
+                    self._shared_cache_set(key, value, ttl)
+            self._cache[key] = (time.monotonic() + ttl, value)
+
+        # The value is cached now, so later callers don't need the lock
+        with self._cache_lock:
+            self._cache_key_locks.pop(key, None)
+        return value
+
+    @classmethod
+    def _get_redis(cls) -> Redis:
+        """Get the Redis connection backing shared cache entries."""
+        if cls._redis is None:
+            cls._redis = Redis.from_url(
+                os.getenv('REDIS_URL', 'redis://localhost:6379'),
+                socket_timeout=2,
+                socket_connect_timeout=2,
+            )
+        return cls._redis
+
+    @classmethod
+    def _shared_cache_key(cls, key: Any) -> str:
+        """Redis key for a cache key, e.g. p5:airtable:today_selected_slots:Oct 17."""
+        parts = key if isinstance(key, tuple) else (key,)
+        return cls.SHARED_CACHE_PREFIX + ':'.join(str(part) for part in parts)
+
+    def _shared_cache_get(self, key: Any) -> Any:
+        """Look up a value in Redis; None on a miss or a Redis error."""
+        try:
+            raw = self._get_redis().get(self._shared_cache_key(key))
+        except Exception as e:
+            logger.warning(f"Airtable cache read failed: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+
+    def _shared_cache_set(self, key: Any, value: Any, ttl: float) -> None:
+        """Store a value in Redis for ttl seconds; Redis errors are non-fatal."""
+        try:
+            self._get_redis().set(
+                self._shared_cache_key(key),
+                orjson.dumps(value),
+                ex=max(1, int(ttl)),
+            )
+        except Exception as e:
+            logger.warning(f"Airtable cache write failed: {e}")
+
+    def _single_flight(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """
+        Run an uncached read, sharing the result with identical concurrent
+        calls.
+
+        The first caller for a key runs the loader; callers arriving while
+        it is in flight wait for and return the same result (or exception).
+        Nothing is kept once the call completes.
+        """
+        with self._cache_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached reads, including the shared copies in Redis."""
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._articles.clear()
+        try:
+            redis = cls._get_redis()
+            keys = list(redis.scan_iter(match=cls.SHARED_CACHE_PREFIX + '*'))
+            if keys:
+                redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Airtable cache clear failed: {e}")
+
+    @classmethod
+    def invalidate_cache(cls, key: Any) -> None:
+        """Drop one cached read (and its Redis copy) so the next call reloads it."""
+        with cls._cache_lock:
+            cls._cache.pop(key, None)
+        try:
+            cls._get_redis().delete(cls._shared_cache_key(key))
+        except Exception as e:
+            logger.warning(f"Airtable cache invalidation failed: {e}")
+
+    @classmethod
+    def invalidate_cache_prefix(cls, prefix: str) -> None:
+        """Drop every cached read whose tuple key starts with prefix (process cache only)."""
+        with cls._cache_lock:
+            for key in [k for k in cls._cache if isinstance(k, tuple) and k[0] == prefix]:
+                del cls._cache[key]
+
+    def _cache_peek(self, key: Any) -> Any:
+        """Return a cached value if present and fresh, else None (never loads)."""
+        entry = self._cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _find_by_field_values(
+        self,
+        base_id: str,
+        table_id: str,
+        field: str,
+        values: List[str],
+        fields: List[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch all records whose field matches any of the given values.
+
+        Values are split into chunks, each matched by one compact formula
+        (see _field_in_formula), and chunks are fetched concurrently instead
+        of one request per value.
+        """
+        values = list(dict.fromkeys(v for v in values if v))
+        if not values:
+            return []
+
+        table = self._get_table(base_id, table_id)
+        fields = self._check_fields(table, fields)
+        chunks = self._chunk_lookup_values(values)
+
+        def fetch(chunk: List[str]) -> List[Dict[str, Any]]:
+            formula = self._field_in_formula(field, chunk)
+            return table.all(formula=formula, fields=fields, page_size=self.PAGE_SIZE)
+
+        with ThreadPoolExecutor(max_workers=min(self.LOOKUP_MAX_WORKERS, len(chunks))) as pool:
+            pages = list(pool.map(fetch, chunks))
+
+        return [record for page in pages for record in page]
+
+    def _table_field_names(self, table: Table) -> frozenset:
+        """Field names defined on a table, from its (cached) Meta API schema."""
+        return self._cached(
+            ('schema_fields', table.base.id, table.name),
+            self.SCHEMA_TTL,
+            lambda: frozenset(f.name for f in table.schema().fields),
+        )
+
+    def _check_fields(self, table: Table, fields: Optional[List[str]]) -> Optional[List[str]]:
+        """
+        Return fields unchanged, raising ValueError first if VALIDATE_FIELDS
+        is on and any of them is not defined on the table.
+        """
+        if not (self.VALIDATE_FIELDS and fields):
+            return fields
+        try:
+            known = self._table_field_names(table)
+        except Exception as e:
+            logger.warning(f"Could not load schema for {table.name}, skipping field check: {e}")
+            return fields
+        unknown = [name for name in fields if name not in known]
+        if unknown:
+            raise ValueError(f"Unknown fields for Airtable table {table.name}: {unknown}")
+        return fields
+
+    def _chunk_lookup_values(self, values: List[str]) -> List[List[str]]:
+        """
+        Split lookup values into chunks of at most LOOKUP_CHUNK_SIZE values
+        and LOOKUP_CHUNK_MAX_CHARS characters (a single oversized value
+        still gets a chunk of its own).
+        """
+        chunks = []
+        chunk: List[str] = []
+        chars = 0
+        for value in values:
+            # +1 for the delimiter or comma between values
+            size = len(value) + 1
+            if chunk and (len(chunk) >= self.LOOKUP_CHUNK_SIZE or chars + size > self.LOOKUP_CHUNK_MAX_CHARS):
+                chunks.append(chunk)
+                chunk, chars = [], 0
+            chunk.append(value)
+            chars += size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _all(self, table: Table, **options: Any) -> List[Dict[str, Any]]:
+        """
+        table.all() for reads with no max_records: full pages, plus a warning
+        when the result is large enough to suggest a missing filter.
+        """
+        options.setdefault('page_size', self.PAGE_SIZE)
+        self._check_fields(table, options.get('fields'))
+        records = table.all(**options)
+        if len(records) > self.RECORD_LIMIT_WARNING:
+            logger.warning(f"Airtable read on {table.name} returned {len(records)} records "
+                           f"({options.get('formula')})")
+        return records
+
+    def _find_record_id(self, table: Table, field: str, value: Any) -> Optional[str]:
+        """
+        Record ID of the first record whose field equals value, or None.
+
+        Used to locate a record before a PATCH; only the key field is
+        requested, so the lookup response carries no row contents.
+        """
+        fields = self._check_fields(table, [field])
+        records = table.all(formula=self._field_equals(field, value), fields=fields, max_records=1)
+        return records[0]['id'] if records else None
+
+    @staticmethod
+    def _field_equals(field: str, value: Any) -> str:
+        """
+        Formula matching records whose field equals value.
+
+        The value is compared as a string, with quotes and backslashes
+        escaped, so IDs and names taken from records can't break the formula.
+        """
+        return f"{field_name(field)} = {quoted(str(value))}"
+
+    @staticmethod
+    def _field_in_formula(field: str, values: List[str]) -> str:
+        """
+        Formula matching records whose field equals any of the values.
+
+        Uses a delimited-list search, FIND('|' & {field} & '|', '|a|b|c|'),
+        which is about a third the length of the equivalent
+        OR({field} = 'a', ...) chain, keeping lookup URLs short. Falls back to
+        OR() if a value contains the delimiter.
+        """
+        if any('|' in value for value in values):
+            conditions = ", ".join(AirtableClient._field_equals(field, value) for value in values)
+            return f"OR({conditions})"
+        haystack = quoted(f"|{'|'.join(values)}|")
+        return f"FIND('|' & {field_name(field)} & '|', {haystack})"
+
+    def _batch_write(
+        self,
+        write: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        records: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply a pyairtable batch method (batch_create, batch_update, ...) to
+        records in WRITE_BATCH_SIZE chunks, sending chunks concurrently.
+
+        Returns:
+            The written records in input order
+
+        Raises:
+            The first chunk error; the other chunks may still have been written
+        """
+        written, failed = self._batch_write_chunks(write, records)
+        if failed:
+            raise failed[0][1]
+        return written
+
+    def _batch_write_chunks(
+        self,
+        write: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        records: List[Dict[str, Any]],
+    ) -> Tuple[List[Dict[str, Any]], _FailedChunks]:
+        """
+        Like _batch_write, but reports each chunk's outcome instead of raising,
+        since every chunk is its own request and one failing doesn't undo the
+        others.
+
+        Returns:
+            (written records in input order, [(chunk, error)] for failed chunks)
+        """
+        if not records:
+            return [], []
+
+        chunks = [
+            records[i:i + self.WRITE_BATCH_SIZE]
+            for i in range(0, len(records), self.WRITE_BATCH_SIZE)
+        ]
+
+        def attempt(chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+            try:
+                return write(chunk), None
+            except Exception as e:
+                return [], e
+
+        if len(chunks) == 1:
+            outcomes = [attempt(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.LOOKUP_MAX_WORKERS, len(chunks))) as pool:
+                outcomes = list(pool.map(attempt, chunks))
+
+        written = [r for batch, _ in outcomes for r in batch]
+        failed = [(chunk, error) for chunk, (_, error) in zip(chunks, outcomes) if error is not None]
+        return written, failed
 
     # === Articles Table (Pivot Media Master) ===
 
     def get_article_by_pivot_id(self, pivot_id: str) -> Optional[Dict[str, Any]]:
-        """Get article by pivot_Id."""
+        """
+        Get article by pivot_Id.
+
+        Found articles are kept for ARTICLE_TTL in a least-recently-used cache
+        of ARTICLE_CACHE_MAXSIZE entries. Callers get their own copy.
+        """
+        with self._cache_lock:
+            entry = self._articles.get(pivot_id)
+            if entry and entry[0] > time.monotonic():
+                self._articles.move_to_end(pivot_id)
+                return dict(entry[1])
+
         table = self._get_table(self.master_base_id, self.articles_table_id)
-        records = table.all(formula=f"{{pivot_Id}} = '{pivot_id}'", max_records=1)
-        return records[0]['fields'] if records else None
+
+        def load() -> Optional[Dict[str, Any]]:
+            records = table.all(formula=self._field_equals('pivot_Id', pivot_id), max_records=1)
+            return records[0]['fields'] if records else None
+
+        article = self._single_flight(('article', pivot_id), load)
+        if article is None:
+            return None
+        self._remember_article(pivot_id, article)
+        return dict(article)
+
+    @classmethod
+    def _remember_article(cls, pivot_id: str, article: Dict[str, Any]) -> None:
+        """Cache an article, evicting expired then least recently used entries when full."""
+        with cls._cache_lock:
+            articles = cls._articles
+            articles[pivot_id] = (time.monotonic() + cls.ARTICLE_TTL, article)
+            articles.move_to_end(pivot_id)
+            if len(articles) <= cls.ARTICLE_CACHE_MAXSIZE:
+                return
+            now = time.monotonic()
+            for key in [k for k, (expires_at, _) in articles.items() if expires_at <= now]:
+                del articles[key]
+            while len(articles) > cls.ARTICLE_CACHE_MAXSIZE:
+                articles.popitem(last=False)
 
     # === Newsletter Stories Table (Pivot Media Master) ===
 
-    def get_newsletter_stories(self, since_date: str = None) -> List[Dict[str, Any]]:
-        """Get newsletter stories, optionally filtered by date."""
+    def iter_newsletter_stories(
+        self,
+        since_date: str = None,
+        exclude_story_ids: List[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream newsletter stories page by page.
+
+        Each page is requested only when the previous one has been consumed,
+        so callers can start work on the first stories while later pages are
+        still to come, and only one page is held at a time.
+
+        Args:
+            since_date: Only stories published after this ISO date
+            exclude_story_ids: storyIDs to filter out server-side
+        """
         table = self._get_table(self.master_base_id, self.stories_table_id)
 
-        formula = None
+        conditions = []
         if since_date:
-            formula = f"IS_AFTER({{date_og_published}}, '{since_date}')"
+            conditions.append(_PUBLISHED_AFTER_FORMULA.format(date=quoted(since_date)))
+        exclude_story_ids = [sid for sid in (exclude_story_ids or []) if sid]
+        if exclude_story_ids:
+            conditions.append(f"NOT({self._field_in_formula('storyID', exclude_story_ids)})")
 
-        records = table.all(formula=formula)
-        return [{'id': r['id'], **r['fields']} for r in records]
+        formula = None
+        if len(conditions) == 1:
+            formula = conditions[0]
+        elif conditions:
+            formula = f"AND({', '.join(conditions)})"
+
+        for page in table.iterate(formula=formula, page_size=self.PAGE_SIZE):
+            for story in _flatten(page):
+                # Share one string object per source/topic instead of one per story
+                for key in _INTERNED_STORY_FIELDS:
+                    value = story.get(key)
+                    if isinstance(value, str):
+                        story[key] = sys.intern(value)
+                yield story
 
     # === Pre-Filter Log Table (AI Editor 2.0) ===
 
-    def create_prefilter_log(self, data: Dict[str, Any]) -> str:
-        """Create a pre-filter log entry."""
-        table = self._get_table(self.editor_base_id, self.prefilter_table_id)
-        record = table.create(data)
-        return record['id']
+    def batched_prefilter_logs(self) -> WriteBuffer:
+        """
+        Buffer for pre-filter log entries produced one story at a time.
 
-    def get_prefilter_candidates(self, slot: int, date: str = None) -> List[Dict[str, Any]]:
-        """Get pre-filter candidates for a slot."""
+        Flushes once enough records are queued to fill a round of concurrent
+        10-record batches, so writes overlap with the caller's remaining work.
+        """
         table = self._get_table(self.editor_base_id, self.prefilter_table_id)
 
+        def write(records: List[Dict[str, Any]]):
+            written, failed = self._batch_write_chunks(table.batch_create, records)
+            if written:
+                self.invalidate_cache_prefix('prefilter_candidates')
+            return written, failed
+
+        return WriteBuffer(write, flush_size=self.WRITE_BATCH_SIZE * self.LOOKUP_MAX_WORKERS)
+
+    def get_prefilter_candidates_by_slot(
+        self,
+        date: str = None,
+        slots: List[int] = None,
+        max_records_per_slot: int = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get pre-filter candidates for several slots with a single query.
+
+        Served from the whole day's candidate buckets (cached briefly), so
+        repeated lookups within a run share that one request.
+
+        Args:
+            date: Pre-filter date (YYYY-MM-DD), defaults to today
+            slots: Slot numbers to fetch, defaults to all five
+            max_records_per_slot: Keep only each slot's most recently
+                published candidates
+
+        Returns:
+            Dict of slot number to candidate records
+        """
         if not date:
             date = datetime.now().strftime('%Y-%m-%d')
 
-        formula = f"AND({{slot}} = {slot}, {{date_prefiltered}} = '{date}')"
-        records = table.all(formula=formula)
-        return [{'id': r['id'], **r['fields']} for r in records]
+        # All five slots need no slot condition at all
+        wanted = tuple(sorted({int(slot) for slot in slots})) if slots else tuple(range(1, 6))
+        slot_filter = wanted if wanted != tuple(range(1, 6)) else ()
+
+        # A subset can be answered from the whole day's buckets if loaded
+        buckets = self._cache_peek(('prefilter_candidates', date, ()))
+        if buckets is None:
+            buckets = self._cached(
+                ('prefilter_candidates', date, slot_filter),
+                self.PREFILTER_CANDIDATES_TTL,
+                lambda: self._load_prefilter_candidates(date, slot_filter),
+            )
+
+        by_slot: Dict[int, List[Dict[str, Any]]] = {}
+        for slot in wanted:
+            records = buckets.get(slot, [])
+            if max_records_per_slot is not None and len(records) > max_records_per_slot:
+                records = sorted(
+                    records,
+                    key=lambda r: r.get('date_og_published') or '',
+                    reverse=True,
+                )[:max_records_per_slot]
+            else:
+                # Callers get their own list; the cached bucket stays intact
+                records = list(records)
+            by_slot[slot] = records
+        return by_slot
+
+    def _load_prefilter_candidates(
+        self,
+        date: str,
+        slot_filter: Tuple[int, ...],
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """Fetch a day's Pre-Filter Log entries and bucket them by slot."""
+        table = self._get_table(self.editor_base_id, self.prefilter_table_id)
+        formula = _prefilter_formula(date, slot_filter)
+
+        buckets: Dict[int, List[Dict[str, Any]]] = {slot: [] for slot in slot_filter or range(1, 6)}
+        for record in _flatten(self._all(table, formula=formula)):
+            try:
+                slot = int(record.get('slot'))
+            except (TypeError, ValueError):
+                continue
+            if slot in buckets:
+                buckets[slot].append(record)
+        return buckets
 
     # === Selected Slots Table (AI Editor 2.0) ===
 
@@ -100,76 +995,115 @@ class AirtableClient:
             "subject_line": data.get("subject_line"),
         }
 
-        for slot_num, slot_data in data.get("slots", {}).items():
-            airtable_data[f"slot_{slot_num}_headline"] = slot_data.get("headline")
-            airtable_data[f"slot_{slot_num}_storyId"] = slot_data.get("storyId")
-            airtable_data[f"slot_{slot_num}_pivotId"] = slot_data.get("pivotId")
+        slots = data.get("slots", {})
+        for slot_num, headline_key, story_key, pivot_key in _SLOT_FIELD_NAMES:
+            slot_data = slots.get(slot_num)
+            if slot_data:
+                airtable_data[headline_key] = slot_data.get("headline")
+                airtable_data[story_key] = slot_data.get("storyId")
+                airtable_data[pivot_key] = slot_data.get("pivotId")
 
         record = table.create(airtable_data)
+        self.invalidate_cache(('today_selected_slots', datetime.now().strftime('%b %d')))
         return record['id']
 
     def get_yesterday_selected_stories(self) -> List[Dict[str, Any]]:
-        """Get yesterday's selected stories."""
+        """Get yesterday's selected stories (cached, yesterday's issue is fixed)."""
+        yesterday = (datetime.now() - timedelta(days=1)).strftime('%b %d')
+        return self._cached(
+            ('yesterday_selected_stories', yesterday),
+            self.YESTERDAY_ISSUE_TTL,
+            lambda: self._load_selected_stories(yesterday),
+            shared=True,
+        )
+
+    def _load_selected_stories(self, issue_day: str) -> List[Dict[str, Any]]:
+        """Load the selected stories for an issue day ('%b %d')."""
         table = self._get_table(self.editor_base_id, self.slots_table_id)
 
-        yesterday = (datetime.now() - timedelta(days=1)).strftime('%b %d')
-        formula = f"SEARCH('{yesterday}', {{issue_date}})"
+        formula = _ISSUE_DAY_FORMULA.format(day=quoted(issue_day))
 
-        records = table.all(formula=formula, max_records=1)
+        fields = self._check_fields(table, _FIELDS_SELECTED_SLOT_STORIES)
+        records = table.all(formula=formula, fields=fields, max_records=1)
         if not records:
             return []
 
         # Extract stories from the flattened format
-        fields = records[0]['fields']
+        get = records[0]['fields'].get
         stories = []
-        for i in range(1, 6):
-            if fields.get(f'slot_{i}_storyId'):
-                stories.append({
-                    'storyID': fields.get(f'slot_{i}_storyId'),
-                    'headline': fields.get(f'slot_{i}_headline'),
-                    'pivotId': fields.get(f'slot_{i}_pivotId'),
-                    'slot': i,
+        append = stories.append
+        for slot_num, headline_key, story_key, pivot_key in _SLOT_FIELD_NAMES:
+            story_id = get(story_key)
+            if story_id:
+                append({
+                    'storyID': story_id,
+                    'headline': get(headline_key),
+                    'pivotId': get(pivot_key),
+                    'slot': slot_num,
                 })
         return stories
 
     def get_today_selected_slots(self) -> Dict[str, Any]:
-        """Get today's selected slots."""
+        """Get today's selected slots (briefly cached; reset by create_selected_slots)."""
+        today = datetime.now().strftime('%b %d')
+        return self._cached(
+            ('today_selected_slots', today),
+            self.TODAY_SLOTS_TTL,
+            lambda: self._load_selected_slots(today),
+            shared=True,
+        )
+
+    def _load_selected_slots(self, issue_day: str) -> Dict[str, Any]:
+        """Load the Selected Slots fields for an issue day ('%b %d')."""
         table = self._get_table(self.editor_base_id, self.slots_table_id)
 
-        today = datetime.now().strftime('%b %d')
-        formula = f"SEARCH('{today}', {{issue_date}})"
+        formula = _ISSUE_DAY_FORMULA.format(day=quoted(issue_day))
 
-        records = table.all(formula=formula, max_records=1)
+        fields = self._check_fields(table, _FIELDS_SELECTED_SLOTS)
+        records = table.all(formula=formula, fields=fields, max_records=1)
         return records[0]['fields'] if records else {}
 
     # === Source Scores Table (AI Editor 2.0) ===
 
     def get_source_scores(self) -> Dict[str, int]:
-        """Get all source credibility scores as a dict."""
-        table = self._get_table(self.editor_base_id, self.source_scores_table_id)
-        records = table.all()
+        """Get all source credibility scores as a dict (cached)."""
+        return self._cached(
+            'source_scores',
+            self.SOURCE_SCORES_TTL,
+            self._load_source_scores,
+            shared=True,
+        )
 
-        scores = {}
-        for r in records:
-            name = r['fields'].get('source_name', '')
-            score = r['fields'].get('credibility_score', 3)
-            if name:
-                scores[name] = score
+    def _load_source_scores(self) -> Dict[str, int]:
+        """Load all source credibility scores from Airtable."""
+        table = self._get_table(self.editor_base_id, self.source_scores_table_id)
 
-        return scores
+        # Stream pages of just the two fields we need; one lookup per field,
+        # skipping rows with no source name
+        fields = self._check_fields(table, _FIELDS_SOURCE_SCORES)
+        pages = table.iterate(page_size=self.PAGE_SIZE, fields=fields)
+        return {
+            name: row.get('credibility_score', 3)
+            for page in pages
+            for row in (r['fields'] for r in page)
+            if (name := row.get('source_name'))
+        }
 
     def update_source_score(self, source_name: str, score: int) -> None:
         """Update or create a source credibility score."""
         table = self._get_table(self.editor_base_id, self.source_scores_table_id)
 
         # Find existing record
-        records = table.all(formula=f"{{source_name}} = '{source_name}'", max_records=1)
+        record_id = self._find_record_id(table, 'source_name', source_name)
 
-        if records:
-            table.update(records[0]['id'], {'credibility_score': score})
+        if record_id:
+            table.update(record_id, {'credibility_score': score})
         else:
             table.create({'source_name': source_name, 'credibility_score': score})
 
+        # Next reader sees the new score instead of waiting out the TTL
+        self.invalidate_cache('source_scores')
+
     # === Decoration Table (AI Editor 2.0) ===
 
     def create_decoration_record(self, data: Dict[str, Any]) -> str:
@@ -182,9 +1116,9 @@ class AirtableClient:
         """Update decoration record with image URL."""
         table = self._get_table(self.editor_base_id, self.decoration_table_id)
 
-        records = table.all(formula=f"{{storyID}} = '{story_id}'", max_records=1)
-        if records:
-            table.update(records[0]['id'], {
+        record_id = self._find_record_id(table, 'storyID', story_id)
+        if record_id:
+            table.update(record_id, {
                 'image_url': image_url,
                 'image_status': 'generated',
             })
@@ -193,19 +1127,21 @@ class AirtableClient:
         """Update decoration record image status."""
         table = self._get_table(self.editor_base_id, self.decoration_table_id)
 
-        records = table.all(formula=f"{{storyID}} = '{story_id}'", max_records=1)
-        if records:
-            table.update(records[0]['id'], {'image_status': status})
+        record_id = self._find_record_id(table, 'storyID', story_id)
+        if record_id:
+            table.update(record_id, {'image_status': status})
 
     def get_decorated_stories_for_issue(self) -> List[Dict[str, Any]]:
         """Get decorated stories ready for newsletter compilation."""
         table = self._get_table(self.editor_base_id, self.decoration_table_id)
 
         today = datetime.now().strftime('%Y-%m-%d')
-        formula = f"AND({{image_status}} = 'generated', IS_SAME({{created_at}}, '{today}', 'day'))"
+        formula = _DECORATED_FOR_DAY_FORMULA.format(day=quoted(today))
 
-        records = table.all(formula=formula)
-        return [{'id': r['id'], **r['fields']} for r in records]
+        return self._single_flight(
+            ('decorated_stories', today),
+            lambda: _flatten(self._all(table, formula=formula)),
+        )
 
     # === Newsletter Issues Table (Pivot Media Master) ===
 
@@ -219,9 +1155,9 @@ class AirtableClient:
         """Update newsletter issue status."""
         table = self._get_table(self.master_base_id, self.issues_table_id)
 
-        records = table.all(formula=f"{{issue_id}} = '{issue_id}'", max_records=1)
-        if records:
-            table.update(records[0]['id'], {'status': status})
+        record_id = self._find_record_id(table, 'issue_id', issue_id)
+        if record_id:
+            table.update(record_id, {'status': status})
 
     # === Archive Table (Pivot Media Master) ===
 
@@ -235,30 +1171,97 @@ class AirtableClient:
 
     # === Social Posts (P5 Social) ===
 
-    def social_post_exists(self, story_id: str) -> bool:
-        """Check if a social post already exists for a story."""
-        table = self._get_table(self.social_base_id, self.social_posts_table_id)
-        records = table.all(formula=f"{{source_record_id}} = '{story_id}'", max_records=1)
-        return len(records) > 0
+    def get_existing_social_post_ids(self, story_ids: List[str]) -> Set[str]:
+        """
+        Return the subset of story IDs that already have a social post.
+
+        IDs already known to have a post are answered locally; the rest are
+        looked up in batched queries.
+        """
+        known = self._known_social_posts
+        existing = {sid for sid in story_ids if sid in known}
+        records = self._find_by_field_values(
+            self.social_base_id,
+            self.social_posts_table_id,
+            'source_record_id',
+            [sid for sid in story_ids if sid not in known],
+            fields=_FIELDS_SOCIAL_POST_KEY,
+        )
+        found = {r['fields'].get('source_record_id') for r in records}
+        found.discard(None)
+        known.update(found)
+        return existing | found
 
     def create_social_post(self, data: Dict[str, Any]) -> str:
         """Create a social post record."""
         table = self._get_table(self.social_base_id, self.social_posts_table_id)
         record = table.create(data)
+        self._remember_social_posts([data])
         return record['id']
 
-    def get_stories_for_social_sync(self) -> List[Dict[str, Any]]:
-        """Get decorated stories that need social sync."""
+    def create_social_posts(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Create social post records in concurrent batches of 10 per request."""
+        table = self._get_table(self.social_base_id, self.social_posts_table_id)
+        created = [r['id'] for r in self._batch_write(table.batch_create, records)]
+        self._remember_social_posts(records)
+        return created
+
+    def _remember_social_posts(self, records: List[Dict[str, Any]]) -> None:
+        """Record the stories of newly created social posts as existing."""
+        self._known_social_posts.update(
+            r['source_record_id'] for r in records if r.get('source_record_id')
+        )
+
+    def get_stories_for_social_sync(self, max_records: int = None) -> List[Dict[str, Any]]:
+        """
+        Get decorated stories that need social sync, newest first.
+
+        Args:
+            max_records: Optional cap; fetched as a single page when <= PAGE_SIZE
+        """
         table = self._get_table(self.editor_base_id, self.decoration_table_id)
 
-        formula = "AND({image_status} = 'generated', OR({social_status} = '', {social_status} = BLANK()))"
-        records = table.all(formula=formula)
-        return [{'id': r['id'], **r['fields']} for r in records]
+        formula = _SOCIAL_SYNC_FORMULA
+        if max_records:
+            records = table.all(
+                formula=formula,
+                fields=self._check_fields(table, _FIELDS_SOCIAL_SYNC),
+                sort=_SOCIAL_SYNC_SORT,
+                max_records=max_records,
+                page_size=min(max_records, self.PAGE_SIZE),
+            )
+        else:
+            records = self._all(table, formula=formula, fields=_FIELDS_SOCIAL_SYNC, sort=_SOCIAL_SYNC_SORT)
+        return _flatten(records)
 
-    def update_story_social_status(self, story_id: str, status: str) -> None:
-        """Update story's social sync status."""
+    def update_social_status_by_record_ids(self, record_ids: List[str], status: str) -> None:
+        """Update social sync status for Decoration records by record ID (batched)."""
         table = self._get_table(self.editor_base_id, self.decoration_table_id)
+        self._batch_write(table.batch_update, [
+            {'id': record_id, 'fields': {'social_status': status}}
+            for record_id in record_ids
+        ])
+
 
-        records = table.all(formula=f"{{storyID}} = '{story_id}'", max_records=1)
-        if records:
-            table.update(records[0]['id'], {'social_status': status})
+_airtable_client: Optional[AirtableClient] = None
+_airtable_client_pid: Optional[int] = None
+_airtable_client_lock = threading.Lock()
+
+
+def get_airtable_client() -> AirtableClient:
+    """
+    Get or create the Airtable client singleton.
+
+    Reusing one client keeps its session's pooled connections warm across
+    calls. RQ runs each job in a forked work horse, so the client is rebuilt
+    if the process has forked since it was created rather than sharing
+    sockets with the parent.
+    """
+    global _airtable_client, _airtable_client_pid
+    pid = os.getpid()
+    if _airtable_client is None or _airtable_client_pid != pid:
+        with _airtable_client_lock:
+            if _airtable_client is None or _airtable_client_pid != pid:
+                _airtable_client = AirtableClient()
+                _airtable_client_pid = pid
+    return _airtable_client
@@ -8,13 +8,62 @@ Prompts are loaded from PostgreSQL database via utils.prompts
 import os
 import json
 import logging
+import threading
 from typing import Dict, Any, List, Optional
-from anthropic import Anthropic
+from anthropic import Anthropic, APIConnectionError, InternalServerError, RateLimitError
 
 from .prompts import get_prompt, get_prompt_with_metadata
+from .rate_limit import RateLimiter, call_with_retry
 
 logger = logging.getLogger(__name__)
 
+# Shared by every ClaudeClient in the process: at most CLAUDE_MAX_CONCURRENCY
+# requests in flight, smoothed to CLAUDE_MAX_RPM requests per minute
+CLAUDE_MAX_CONCURRENCY = int(os.getenv('CLAUDE_MAX_CONCURRENCY', '5'))
+CLAUDE_MAX_RPM = float(os.getenv('CLAUDE_MAX_RPM', '50'))
+_claude_gate = threading.BoundedSemaphore(CLAUDE_MAX_CONCURRENCY)
+_claude_limiter = RateLimiter(CLAUDE_MAX_RPM / 60, capacity=CLAUDE_MAX_CONCURRENCY)
+
+# Transient Claude errors worth retrying (429, 5xx/overloaded, network)
+_CLAUDE_RETRYABLE = (RateLimitError, InternalServerError, APIConnectionError)
+CLAUDE_MAX_ATTEMPTS = 6
+
+
+def create_message(client: Anthropic, **kwargs):
+    """
+    Create a message through the process-wide concurrency gate and rate
+    limiter, retrying 429/5xx/connection errors with jittered exponential
+    backoff (10s doubling, capped at 60s).
+
+    The gate is held for each attempt only, so a request sleeping between
+    retries doesn't keep another one waiting. Build the client with
+    max_retries=0 so the SDK doesn't retry underneath this.
+
+    Args:
+        client: Anthropic client
+        **kwargs: Arguments for client.messages.create
+
+    Returns:
+        The Message response
+    """
+    def attempt():
+        with _claude_gate:
+            return client.messages.create(**kwargs)
+
+    return call_with_retry(
+        attempt,
+        retry_on=_CLAUDE_RETRYABLE,
+        attempts=CLAUDE_MAX_ATTEMPTS,
+        base_delay=10.0,
+        max_delay=60.0,
+        limiter=_claude_limiter,
+    )
+
+
+def _join_sorted(values, empty: str = '(none yet)') -> str:
+    """Join values in sorted order so prompts are deterministic for sets"""
+    return ', '.join(sorted(values)) if values else empty
+
 
 class ClaudeClient:
     """Claude API wrapper for AI Editor 2.0"""
@@ -24,11 +73,16 @@ class ClaudeClient:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable is required")
 
-        self.client = Anthropic(api_key=self.api_key)
+        # Retries are handled by create_message so backoff is shared with the gate
+        self.client = Anthropic(api_key=self.api_key, max_retries=0)
 
         # Default model (can be overridden by prompt metadata)
         self.default_model = "claude-sonnet-4-5-20250929"
 
+    def _create_message(self, **kwargs):
+        """Create a message through the shared gate, limiter and retries."""
+        return create_message(self.client, **kwargs)
+
     # =========================================================================
     # STEP 2: SLOT SELECTION
     # =========================================================================
@@ -55,7 +109,7 @@ class ClaudeClient:
         system_prompt = self._build_slot_system_prompt(slot, yesterday_data, cumulative_state)
         user_prompt = self._build_slot_user_prompt(candidates)
 
-        response = self.client.messages.create(
+        response = self._create_message(
             model=self.default_model,
             max_tokens=2000,
             temperature=0.5,
@@ -84,6 +138,10 @@ class ClaudeClient:
         selected_today = cumulative_state.get('selectedToday', [])
         selected_companies = cumulative_state.get('selectedCompanies', [])
         selected_sources = cumulative_state.get('selectedSources', [])
+        # Sorted so the prompt text is identical for identical state
+        selected_stories_text = _join_sorted(selected_today)
+        selected_companies_text = _join_sorted(selected_companies)
+        selected_sources_text = _join_sorted(selected_sources)
         yesterday_slot = yesterday_headlines[slot - 1] if len(yesterday_headlines) >= slot else "(none)"
 
         if prompt_template:
@@ -92,9 +150,9 @@ class ClaudeClient:
                 # Note: {candidates} will be filled in by _build_slot_user_prompt
                 prompt = prompt_template.format(
                     candidates="(See candidates below)",
-                    selected_stories=', '.join(selected_today) if selected_today else '(none yet)',
-                    selected_companies=', '.join(selected_companies) if selected_companies else '(none yet)',
-                    selected_sources=', '.join(selected_sources) if selected_sources else '(none yet)',
+                    selected_stories=selected_stories_text,
+                    selected_companies=selected_companies_text,
+                    selected_sources=selected_sources_text,
                     yesterday_slot=yesterday_slot
                 )
 
@@ -123,13 +181,13 @@ CURRENT CONTEXT:
 {chr(10).join(f"   - {h}" for h in yesterday_headlines) if yesterday_headlines else '   (none)'}
 
 2. ALREADY SELECTED TODAY - Do NOT select these storyIDs:
-   {', '.join(selected_today) if selected_today else '(none yet)'}
+   {selected_stories_text}
 
 3. COMPANY DIVERSITY - Each company appears at most ONCE across all 5 slots:
-   Already featured today: {', '.join(selected_companies) if selected_companies else '(none yet)'}
+   Already featured today: {selected_companies_text}
 
 4. SOURCE DIVERSITY - Max 2 stories per source per day:
-   Already used today: {', '.join(selected_sources) if selected_sources else '(none yet)'}
+   Already used today: {selected_sources_text}
 """
 
         # Slot 1 has special two-day rotation rule
@@ -243,7 +301,7 @@ Return ONLY the subject line, no quotes or explanation."""
         model = prompt_meta.get('model', self.default_model) if prompt_meta else self.default_model
         temperature = prompt_meta.get('temperature', 0.7) if prompt_meta else 0.7
 
-        response = self.client.messages.create(
+        response = self._create_message(
             model=model,
             max_tokens=100,
             temperature=float(temperature),
@@ -372,7 +430,7 @@ Return JSON only."""
         model = prompt_meta.get('model', self.default_model) if prompt_meta else self.default_model
         temperature = prompt_meta.get('temperature', 0.5) if prompt_meta else 0.5
 
-        response = self.client.messages.create(
+        response = self._create_message(
             model=model,
             max_tokens=1500,
             temperature=float(temperature),
@@ -428,7 +486,7 @@ Return JSON only:
         model = prompt_meta.get('model', self.default_model) if prompt_meta else self.default_model
         temperature = prompt_meta.get('temperature', 0.3) if prompt_meta else 0.3
 
-        response = self.client.messages.create(
+        response = self._create_message(
             model=model,
             max_tokens=500,
             temperature=float(temperature),
@@ -521,7 +579,7 @@ Return JSON only:
         model = prompt_meta.get('model', self.default_model) if prompt_meta else self.default_model
         temperature = prompt_meta.get('temperature', 0.5) if prompt_meta else 0.5
 
-        response = self.client.messages.create(
+        response = self._create_message(
             model=model,
             max_tokens=100,
             temperature=float(temperature),
@@ -14,8 +14,9 @@ n8n Workflow Architecture (IMPLEMENTED):
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
 import google.generativeai as genai
+import orjson
 
 from .prompts import get_prompt, get_prompt_with_metadata
 
@@ -56,6 +57,95 @@ SLOT_CRITERIA = {
 }
 
 
+# Fallback batch pre-filter prompts (used when no database prompt is set).
+# str.format templates taking the same variables as the database prompts.
+_BATCH_PROMPT_FOOTER = """
+
+YESTERDAY'S HEADLINES (avoid similar topics):
+{yesterday_headlines}
+
+CANDIDATES:
+{candidates}
+
+Return ONLY valid JSON with matching story IDs:
+{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
+
+If no stories match, return: {{"matches": []}}"""
+
+BATCH_FALLBACK_PROMPTS = {
+    1: """You are a pre-filter for an AI newsletter's LEAD STORY slot (Slot 1: Jobs/Economy).
+
+Review these candidates and identify ONLY stories about:
+1. AI impact on JOBS (layoffs, hiring, workforce changes, labor market shifts)
+2. AI impact on ECONOMY (GDP, productivity, economic shifts, market trends)
+3. AI STOCK MARKET / VALUATIONS (market moves, IPOs, funding rounds, valuations)
+4. BROAD AI IMPACT (societal, regulatory impact - NOT company-specific product launches)
+
+IMPORTANT EXCLUSIONS:
+- Do NOT include simple product launches or feature updates
+- Do NOT include stories that are primarily about a single company's products
+- Focus on BROAD impact stories that affect multiple companies or the industry""" + _BATCH_PROMPT_FOOTER,
+    2: """You are a pre-filter for an AI newsletter's Slot 2: Tier 1 Companies / Insight.
+
+Review these candidates and identify stories about:
+1. TIER 1 AI COMPANIES: OpenAI, Google/DeepMind, Meta, NVIDIA, Microsoft, Anthropic, xAI, Amazon
+2. Major product launches, updates, or news from these Tier 1 companies
+3. AI research papers, studies, or insight pieces from credible sources
+4. Broad AI industry analysis or trends
+
+IMPORTANT:
+- Tier 1 company news belongs HERE, not in Slot 4 (Emerging Companies)
+- Research/insight pieces should be from credible sources
+- Product launches from Tier 1 companies go here""" + _BATCH_PROMPT_FOOTER,
+    3: """You are a pre-filter for an AI newsletter's Slot 3: Industry Impact.
+
+Review these candidates and identify stories about AI's impact on NON-TECH INDUSTRIES:
+- Healthcare / Medical
+- Government / Public Sector
+- Education
+- Legal / Law
+- Accounting / Finance (traditional, not fintech)
+- Retail / E-commerce
+- Security / Defense
+- Transportation / Logistics
+- Manufacturing
+- Real Estate
+- Agriculture
+- Energy / Utilities
+
+IMPORTANT EXCLUSIONS:
+- Do NOT include stories primarily about TECH companies or startups
+- Do NOT include human interest or consumer-focused stories
+- Focus on how AI is transforming traditional industries""" + _BATCH_PROMPT_FOOTER,
+    4: """You are a pre-filter for an AI newsletter's Slot 4: Emerging Companies.
+
+Review these candidates and identify stories about:
+1. Smaller/emerging AI companies (NOT Tier 1 giants)
+2. AI startup news: funding rounds, acquisitions, partnerships
+3. New AI product launches from non-Tier-1 companies
+4. Innovative AI tools and applications from emerging players
+
+TIER 1 COMPANIES TO EXCLUDE (these go in Slot 2):
+OpenAI, Google, Meta, NVIDIA, Microsoft, Anthropic, xAI, Amazon
+
+IMPORTANT EXCLUSIONS:
+- Do NOT include Tier 1 company news (goes to Slot 2)
+- Do NOT include industry-specific verticals (goes to Slot 3)
+- Do NOT include human interest or consumer lifestyle stories (goes to Slot 5)""" + _BATCH_PROMPT_FOOTER,
+    5: """You are a pre-filter for an AI newsletter's Slot 5: Consumer AI.
+
+Review these candidates and identify stories about:
+1. AI's impact on HUMANITY and SOCIETY (philosophical, ethical)
+2. Consumer AI products (apps, tools for everyday people)
+3. AI in ARTS, ENTERTAINMENT, and CREATIVITY
+4. AI ethics and philosophical questions
+5. Fun, quirky, surprising, or unusual uses of AI
+6. "Nice to know" stories (not "need to know" business news)
+
+This slot is for lighter, more human-interest stories that readers will enjoy.""" + _BATCH_PROMPT_FOOTER,
+}
+
+
 class GeminiClient:
     """Gemini API wrapper for AI Editor 2.0"""
 
@@ -109,9 +199,9 @@ class GeminiClient:
                 )
             )
 
-            result = json.loads(response.text)
+            result = orjson.loads(response.text)
             return result
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Fallback: try to extract JSON from response
             return self._parse_prefilter_response(response.text)
         except Exception as e:
@@ -206,8 +296,8 @@ Return JSON only:
         json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
         if json_match:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(json_match.group())
+            except orjson.JSONDecodeError:
                 pass
 
         # Default: no eligible slots
@@ -273,33 +363,34 @@ Return ONLY the cleaned article content, no explanations."""
     # BATCH PROCESSING METHODS (Matches n8n Workflow Exactly)
     # =========================================================================
 
-    def prefilter_batch_slot_1(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
+    def prefilter_batch(self, slot: int, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
         """
-        Slot 1 Batch Pre-Filter: Jobs/Economy
-
-        n8n Workflow: Node 13 - Gemini Slot 1 Pre-Filter
+        Batch pre-filter for a single slot.
 
         Args:
+            slot: Slot number (1-5)
             articles: List of article dicts with story_id, headline, summary, source_score, freshness_hours
             yesterday_headlines: Headlines from yesterday's issue for diversity
 
         Returns:
             List of matching articles: [{story_id, headline}]
 
-        Uses chunking for large batches to prevent Gemini response truncation.
+        Uses the slot_N_prefilter database prompt when available, otherwise the
+        matching BATCH_FALLBACK_PROMPTS entry. Large batches are chunked to
+        prevent Gemini response truncation.
         """
         if not articles:
             return []
 
+        slot_name = f"slot_{slot}"
         yesterday_text = "\n".join(f"- {h}" for h in yesterday_headlines) if yesterday_headlines else "None"
 
         # Try to load prompt template from database
-        prompt_template = get_prompt('slot_1_prefilter')
-        use_db_prompt = False
-
+        prompt_template = get_prompt(f'{slot_name}_prefilter')
         if prompt_template:
-            use_db_prompt = True
-            logger.info("[Gemini slot_1] Using prompt from database")
+            logger.info(f"[Gemini {slot_name}] Using prompt from database")
+        else:
+            prompt_template = BATCH_FALLBACK_PROMPTS[slot]
 
         # Chunk large batches to prevent Gemini response truncation
         all_matches = []
@@ -307,343 +398,67 @@ Return ONLY the cleaned article content, no explanations."""
 
         for i, chunk in enumerate(chunks):
             if len(chunks) > 1:
-                logger.info(f"[Gemini slot_1] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
-
-            candidates_json = json.dumps(chunk, indent=2)
-
-            if use_db_prompt:
-                try:
-                    prompt = prompt_template.format(
-                        yesterday_headlines=yesterday_text,
-                        candidates=candidates_json
-                    )
-                except KeyError as e:
-                    logger.warning(f"[Gemini slot_1] Missing variable in database prompt: {e}, using fallback")
-                    use_db_prompt = False
-
-            if not use_db_prompt:
-                prompt = f"""You are a pre-filter for an AI newsletter's LEAD STORY slot (Slot 1: Jobs/Economy).
-
-Review these candidates and identify ONLY stories about:
-1. AI impact on JOBS (layoffs, hiring, workforce changes, labor market shifts)
-2. AI impact on ECONOMY (GDP, productivity, economic shifts, market trends)
-3. AI STOCK MARKET / VALUATIONS (market moves, IPOs, funding rounds, valuations)
-4. BROAD AI IMPACT (societal, regulatory impact - NOT company-specific product launches)
-
-IMPORTANT EXCLUSIONS:
-- Do NOT include simple product launches or feature updates
-- Do NOT include stories that are primarily about a single company's products
-- Focus on BROAD impact stories that affect multiple companies or the industry
-
-YESTERDAY'S HEADLINES (avoid similar topics):
-{yesterday_text}
+                logger.info(f"[Gemini {slot_name}] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
 
-CANDIDATES:
-{candidates_json}
+            candidates_json = orjson.dumps(chunk, option=orjson.OPT_INDENT_2).decode()
 
-Return ONLY valid JSON with matching story IDs:
-{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
-
-If no stories match, return: {{"matches": []}}"""
+            try:
+                prompt = prompt_template.format(
+                    yesterday_headlines=yesterday_text,
+                    candidates=candidates_json
+                )
+            except KeyError as e:
+                logger.warning(f"[Gemini {slot_name}] Missing variable in database prompt: {e}, using fallback")
+                prompt_template = BATCH_FALLBACK_PROMPTS[slot]
+                prompt = prompt_template.format(
+                    yesterday_headlines=yesterday_text,
+                    candidates=candidates_json
+                )
 
-            matches = self._execute_batch_prefilter(prompt, f"slot_1_chunk_{i+1}")
+            matches = self._execute_batch_prefilter(prompt, f"{slot_name}_chunk_{i+1}")
             all_matches.extend(matches)
 
         return all_matches
 
+    def prefilter_batch_slot_1(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
+        """
+        Slot 1 Batch Pre-Filter: Jobs/Economy
+
+        n8n Workflow: Node 13 - Gemini Slot 1 Pre-Filter
+        """
+        return self.prefilter_batch(1, articles, yesterday_headlines)
+
     def prefilter_batch_slot_2(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
         """
         Slot 2 Batch Pre-Filter: Tier 1 / Insight
 
         n8n Workflow: Node 17 - Gemini Slot 2 Pre-Filter
-
-        Uses chunking for large batches to prevent Gemini response truncation.
         """
-        if not articles:
-            return []
-
-        yesterday_text = "\n".join(f"- {h}" for h in yesterday_headlines) if yesterday_headlines else "None"
-
-        # Try to load prompt template from database
-        prompt_template = get_prompt('slot_2_prefilter')
-        use_db_prompt = False
-
-        if prompt_template:
-            use_db_prompt = True
-            logger.info("[Gemini slot_2] Using prompt from database")
-
-        # Chunk large batches to prevent Gemini response truncation
-        all_matches = []
-        chunks = self._chunk_articles(articles, chunk_size=15)
-
-        for i, chunk in enumerate(chunks):
-            if len(chunks) > 1:
-                logger.info(f"[Gemini slot_2] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
-
-            candidates_json = json.dumps(chunk, indent=2)
-
-            if use_db_prompt:
-                try:
-                    prompt = prompt_template.format(
-                        yesterday_headlines=yesterday_text,
-                        candidates=candidates_json
-                    )
-                except KeyError as e:
-                    logger.warning(f"[Gemini slot_2] Missing variable in database prompt: {e}, using fallback")
-                    use_db_prompt = False
-
-            if not use_db_prompt:
-                prompt = f"""You are a pre-filter for an AI newsletter's Slot 2: Tier 1 Companies / Insight.
-
-Review these candidates and identify stories about:
-1. TIER 1 AI COMPANIES: OpenAI, Google/DeepMind, Meta, NVIDIA, Microsoft, Anthropic, xAI, Amazon
-2. Major product launches, updates, or news from these Tier 1 companies
-3. AI research papers, studies, or insight pieces from credible sources
-4. Broad AI industry analysis or trends
-
-IMPORTANT:
-- Tier 1 company news belongs HERE, not in Slot 4 (Emerging Companies)
-- Research/insight pieces should be from credible sources
-- Product launches from Tier 1 companies go here
-
-YESTERDAY'S HEADLINES (avoid similar topics):
-{yesterday_text}
-
-CANDIDATES:
-{candidates_json}
-
-Return ONLY valid JSON with matching story IDs:
-{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
-
-If no stories match, return: {{"matches": []}}"""
-
-            matches = self._execute_batch_prefilter(prompt, f"slot_2_chunk_{i+1}")
-            all_matches.extend(matches)
-
-        return all_matches
+        return self.prefilter_batch(2, articles, yesterday_headlines)
 
     def prefilter_batch_slot_3(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
         """
         Slot 3 Batch Pre-Filter: Industry Impact
 
         n8n Workflow: Node 21 - Gemini Slot 3 Pre-Filter
-
-        Uses chunking for large batches to prevent Gemini response truncation.
         """
-        if not articles:
-            return []
-
-        yesterday_text = "\n".join(f"- {h}" for h in yesterday_headlines) if yesterday_headlines else "None"
-
-        # Try to load prompt template from database
-        prompt_template = get_prompt('slot_3_prefilter')
-        use_db_prompt = False
-
-        if prompt_template:
-            use_db_prompt = True
-            logger.info("[Gemini slot_3] Using prompt from database")
-
-        # Chunk large batches to prevent Gemini response truncation
-        all_matches = []
-        chunks = self._chunk_articles(articles, chunk_size=15)
-
-        for i, chunk in enumerate(chunks):
-            if len(chunks) > 1:
-                logger.info(f"[Gemini slot_3] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
-
-            candidates_json = json.dumps(chunk, indent=2)
-
-            if use_db_prompt:
-                try:
-                    prompt = prompt_template.format(
-                        yesterday_headlines=yesterday_text,
-                        candidates=candidates_json
-                    )
-                except KeyError as e:
-                    logger.warning(f"[Gemini slot_3] Missing variable in database prompt: {e}, using fallback")
-                    use_db_prompt = False
-
-            if not use_db_prompt:
-                prompt = f"""You are a pre-filter for an AI newsletter's Slot 3: Industry Impact.
-
-Review these candidates and identify stories about AI's impact on NON-TECH INDUSTRIES:
-- Healthcare / Medical
-- Government / Public Sector
-- Education
-- Legal / Law
-- Accounting / Finance (traditional, not fintech)
-- Retail / E-commerce
-- Security / Defense
-- Transportation / Logistics
-- Manufacturing
-- Real Estate
-- Agriculture
-- Energy / Utilities
-
-IMPORTANT EXCLUSIONS:
-- Do NOT include stories primarily about TECH companies or startups
-- Do NOT include human interest or consumer-focused stories
-- Focus on how AI is transforming traditional industries
-
-YESTERDAY'S HEADLINES (avoid similar topics):
-{yesterday_text}
-
-CANDIDATES:
-{candidates_json}
-
-Return ONLY valid JSON with matching story IDs:
-{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
-
-If no stories match, return: {{"matches": []}}"""
-
-            matches = self._execute_batch_prefilter(prompt, f"slot_3_chunk_{i+1}")
-            all_matches.extend(matches)
-
-        return all_matches
+        return self.prefilter_batch(3, articles, yesterday_headlines)
 
     def prefilter_batch_slot_4(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
         """
         Slot 4 Batch Pre-Filter: Emerging Companies
 
         n8n Workflow: Node 25 - Gemini Slot 4 Pre-Filter
-
-        Uses chunking for large batches to prevent Gemini response truncation.
         """
-        if not articles:
-            return []
-
-        yesterday_text = "\n".join(f"- {h}" for h in yesterday_headlines) if yesterday_headlines else "None"
-
-        # Try to load prompt template from database
-        prompt_template = get_prompt('slot_4_prefilter')
-        use_db_prompt = False
-
-        if prompt_template:
-            use_db_prompt = True
-            logger.info("[Gemini slot_4] Using prompt from database")
-
-        # Chunk large batches to prevent Gemini response truncation
-        all_matches = []
-        chunks = self._chunk_articles(articles, chunk_size=15)
-
-        for i, chunk in enumerate(chunks):
-            if len(chunks) > 1:
-                logger.info(f"[Gemini slot_4] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
-
-            candidates_json = json.dumps(chunk, indent=2)
-
-            if use_db_prompt:
-                try:
-                    prompt = prompt_template.format(
-                        yesterday_headlines=yesterday_text,
-                        candidates=candidates_json
-                    )
-                except KeyError as e:
-                    logger.warning(f"[Gemini slot_4] Missing variable in database prompt: {e}, using fallback")
-                    use_db_prompt = False
-
-            if not use_db_prompt:
-                prompt = f"""You are a pre-filter for an AI newsletter's Slot 4: Emerging Companies.
-
-Review these candidates and identify stories about:
-1. Smaller/emerging AI companies (NOT Tier 1 giants)
-2. AI startup news: funding rounds, acquisitions, partnerships
-3. New AI product launches from non-Tier-1 companies
-4. Innovative AI tools and applications from emerging players
-
-TIER 1 COMPANIES TO EXCLUDE (these go in Slot 2):
-OpenAI, Google, Meta, NVIDIA, Microsoft, Anthropic, xAI, Amazon
-
-IMPORTANT EXCLUSIONS:
-- Do NOT include Tier 1 company news (goes to Slot 2)
-- Do NOT include industry-specific verticals (goes to Slot 3)
-- Do NOT include human interest or consumer lifestyle stories (goes to Slot 5)
-
-YESTERDAY'S HEADLINES (avoid similar topics):
-{yesterday_text}
-
-CANDIDATES:
-{candidates_json}
-
-Return ONLY valid JSON with matching story IDs:
-{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
-
-If no stories match, return: {{"matches": []}}"""
-
-            matches = self._execute_batch_prefilter(prompt, f"slot_4_chunk_{i+1}")
-            all_matches.extend(matches)
-
-        return all_matches
+        return self.prefilter_batch(4, articles, yesterday_headlines)
 
     def prefilter_batch_slot_5(self, articles: List[Dict], yesterday_headlines: List[str]) -> List[Dict]:
         """
         Slot 5 Batch Pre-Filter: Consumer AI
 
         n8n Workflow: Node 29 - Gemini Slot 5 Pre-Filter
-
-        Uses chunking for large batches to prevent Gemini response truncation.
         """
-        if not articles:
-            return []
-
-        yesterday_text = "\n".join(f"- {h}" for h in yesterday_headlines) if yesterday_headlines else "None"
-
-        # Try to load prompt template from database
-        prompt_template = get_prompt('slot_5_prefilter')
-        use_db_prompt = False
-
-        if prompt_template:
-            use_db_prompt = True
-            logger.info("[Gemini slot_5] Using prompt from database")
-
-        # Chunk large batches to prevent Gemini response truncation
-        all_matches = []
-        chunks = self._chunk_articles(articles, chunk_size=15)
-
-        for i, chunk in enumerate(chunks):
-            if len(chunks) > 1:
-                logger.info(f"[Gemini slot_5] Processing chunk {i+1}/{len(chunks)} ({len(chunk)} articles)")
-
-            candidates_json = json.dumps(chunk, indent=2)
-
-            if use_db_prompt:
-                try:
-                    prompt = prompt_template.format(
-                        yesterday_headlines=yesterday_text,
-                        candidates=candidates_json
-                    )
-                except KeyError as e:
-                    logger.warning(f"[Gemini slot_5] Missing variable in database prompt: {e}, using fallback")
-                    use_db_prompt = False
-
-            if not use_db_prompt:
-                prompt = f"""You are a pre-filter for an AI newsletter's Slot 5: Consumer AI.
-
-Review these candidates and identify stories about:
-1. AI's impact on HUMANITY and SOCIETY (philosophical, ethical)
-2. Consumer AI products (apps, tools for everyday people)
-3. AI in ARTS, ENTERTAINMENT, and CREATIVITY
-4. AI ethics and philosophical questions
-5. Fun, quirky, surprising, or unusual uses of AI
-6. "Nice to know" stories (not "need to know" business news)
-
-This slot is for lighter, more human-interest stories that readers will enjoy.
-
-YESTERDAY'S HEADLINES (avoid similar topics):
-{yesterday_text}
-
-CANDIDATES:
-{candidates_json}
-
-Return ONLY valid JSON with matching story IDs:
-{{"matches": [{{"story_id": "recXXX", "headline": "headline text"}}]}}
-
-If no stories match, return: {{"matches": []}}"""
-
-            matches = self._execute_batch_prefilter(prompt, f"slot_5_chunk_{i+1}")
-            all_matches.extend(matches)
-
-        return all_matches
+        return self.prefilter_batch(5, articles, yesterday_headlines)
 
     def _execute_batch_prefilter(self, prompt: str, slot_name: str, retry_count: int = 0) -> List[Dict]:
         """
@@ -666,18 +481,21 @@ If no stories match, return: {{"matches": []}}"""
                     temperature=0.3,
                     max_output_tokens=8192,  # Increased from 4096 for large batches
                     response_mime_type="application/json"
-                )
+                ),
+                stream=True,
             )
 
-            result = json.loads(response.text)
-            matches = result.get('matches', [])
+            # Decode matches while the rest of the response is still streaming
+            matches, text = self._stream_batch_matches(response)
+            if matches is None:
+                raise orjson.JSONDecodeError("No matches array in response", text, 0)
             logger.info(f"[Gemini {slot_name}] Found {len(matches)} matches")
             return matches
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"[Gemini {slot_name}] JSON parse error: {e}")
             # Try to extract partial matches from truncated response
-            partial_matches = self._parse_batch_response(response.text)
+            partial_matches = self._parse_batch_response(e.doc)
             if partial_matches:
                 logger.info(f"[Gemini {slot_name}] Recovered {len(partial_matches)} matches from partial response")
                 return partial_matches
@@ -696,6 +514,51 @@ If no stories match, return: {{"matches": []}}"""
                 return self._execute_batch_prefilter(prompt, slot_name, retry_count + 1)
             return []
 
+    def _stream_batch_matches(self, response) -> Tuple[Optional[List[Dict]], str]:
+        """
+        Incrementally decode {"matches": [...]} from a streamed response.
+
+        Each match object is decoded as soon as it is complete, so parsing
+        overlaps with the remaining network transfer and a truncated response
+        still yields every finished match.
+
+        Returns:
+            (matches, full_text); matches is None if no matches array was found
+        """
+        decoder = json.JSONDecoder()
+        text = ""
+        pos = None  # Index inside the matches array, once located
+        done = False
+        matches = []
+
+        for chunk in response:
+            text += chunk.text
+            if done:
+                continue
+
+            if pos is None:
+                key = text.find('"matches"')
+                bracket = text.find('[', key) if key != -1 else -1
+                if bracket == -1:
+                    continue
+                pos = bracket + 1
+
+            while True:
+                while pos < len(text) and text[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos >= len(text):
+                    break
+                if text[pos] == ']':
+                    done = True
+                    break
+                try:
+                    match, pos = decoder.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    break  # Object still incomplete, wait for more text
+                matches.append(match)
+
+        return (matches if pos is not None else None), text
+
     def _chunk_articles(self, articles: List[Dict], chunk_size: int = 15) -> List[List[Dict]]:
         """Split articles into smaller chunks for reliable Gemini processing."""
         return [articles[i:i + chunk_size] for i in range(0, len(articles), chunk_size)]
@@ -708,9 +571,9 @@ If no stories match, return: {{"matches": []}}"""
         json_match = re.search(r'\{[\s\S]*"matches"[\s\S]*\}', text)
         if json_match:
             try:
-                result = json.loads(json_match.group())
+                result = orjson.loads(json_match.group())
                 return result.get('matches', [])
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         return []
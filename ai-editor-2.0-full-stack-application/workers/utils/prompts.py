@@ -23,6 +23,30 @@ _prompt_cache: Dict[str, Dict[str, Any]] = {}
 _cache_initialized = False
 
 
+def _get_prompt_data(prompt_key: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+    """
+    Get the full prompt row for a key, from the cache when possible.
+
+    After preload_all_prompts() the cache holds every active prompt, so a
+    miss means the key doesn't exist and no query is made.
+    """
+    if use_cache:
+        if prompt_key in _prompt_cache:
+            return _prompt_cache[prompt_key]
+        if _cache_initialized:
+            logger.warning(f"Prompt not found: {prompt_key}")
+            return None
+
+    db = get_db()
+    prompt_data = db.get_prompt_by_key(prompt_key)
+
+    if prompt_data:
+        _prompt_cache[prompt_key] = prompt_data
+    else:
+        logger.warning(f"Prompt not found: {prompt_key}")
+    return prompt_data
+
+
 def get_prompt(prompt_key: str, use_cache: bool = True) -> Optional[str]:
     """
     Get prompt content by key from database
@@ -34,22 +58,9 @@ def get_prompt(prompt_key: str, use_cache: bool = True) -> Optional[str]:
     Returns:
         The prompt content string, or None if not found
     """
-    global _prompt_cache, _cache_initialized
-
-    # Check cache first
-    if use_cache and prompt_key in _prompt_cache:
-        return _prompt_cache[prompt_key].get('content')
-
     try:
-        db = get_db()
-        prompt_data = db.get_prompt_by_key(prompt_key)
-
-        if prompt_data:
-            _prompt_cache[prompt_key] = prompt_data
-            return prompt_data.get('content')
-        else:
-            logger.warning(f"Prompt not found: {prompt_key}")
-            return None
+        prompt_data = _get_prompt_data(prompt_key, use_cache)
+        return prompt_data.get('content') if prompt_data else None
 
     except Exception as e:
         logger.error(f"Error loading prompt {prompt_key}: {e}")
@@ -60,6 +71,9 @@ def get_prompt_with_metadata(prompt_key: str) -> Optional[Dict[str, Any]]:
     """
     Get prompt with full metadata (model, temperature, etc.)
 
+    Served from the same cache as get_prompt, so per-story calls within a
+    job don't each query the database.
+
     Returns:
         {
             prompt_key, content, model, temperature,
@@ -67,8 +81,7 @@ def get_prompt_with_metadata(prompt_key: str) -> Optional[Dict[str, Any]]:
         }
     """
     try:
-        db = get_db()
-        return db.get_prompt_by_key(prompt_key)
+        return _get_prompt_data(prompt_key)
     except Exception as e:
         logger.error(f"Error loading prompt metadata {prompt_key}: {e}")
         return None
@@ -0,0 +1,79 @@
+"""
+Rate Limiting and Retry Helpers for AI Editor 2.0 Workers
+Keeps concurrent API callers (Gemini, Claude, Airtable) inside provider limits
+"""
+
+import random
+import threading
+import time
+import logging
+from typing import Callable, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: int = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    retry_on: Tuple[Type[BaseException], ...],
+    attempts: int = 4,
+    base_delay: float = 1.0,
+    max_delay: float = 20.0,
+    limiter: RateLimiter = None,
+    on_retry: Callable[[BaseException], None] = None,
+) -> T:
+    """
+    Call func, retrying transient errors with exponential backoff and jitter.
+
+    Args:
+        func: Zero-argument callable making the request
+        retry_on: Exception types that are safe to retry
+        attempts: Total attempts including the first
+        base_delay: Delay before the first retry (doubles each retry)
+        max_delay: Upper bound on a single delay
+        limiter: Optional rate limiter acquired before every attempt
+        on_retry: Optional callback invoked with the error before each retry
+
+    Returns:
+        The result of func
+    """
+    for attempt in range(attempts):
+        if limiter:
+            limiter.acquire()
+        try:
+            return func()
+        except retry_on as e:
+            if attempt == attempts - 1:
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            delay = random.uniform(delay / 2, delay)
+            logger.warning(f"Transient error ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 2}/{attempts})")
+            if on_retry:
+                on_retry(e)
+            time.sleep(delay)
@@ -7,6 +7,7 @@ Run with: python worker.py
 
 import os
 import sys
+import importlib
 from redis import Redis
 from rq import Worker, Queue
 from dotenv import load_dotenv
@@ -20,10 +21,38 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Redis connection
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379')
 
+# Job modules imported once in the parent process. RQ forks a work horse
+# per job, so children inherit these (and their SDK imports) instead of
+# re-importing anthropic/genai/pyairtable on every job.
+JOB_MODULES = [
+    'jobs.ingest',
+    'jobs.ai_scoring',
+    'jobs.prefilter',
+    'jobs.slot_selection',
+    'jobs.decoration',
+    'jobs.image_generation',
+    'jobs.html_compile',
+    'jobs.mautic_send',
+    'jobs.social_sync',
+    'jobs.ingest_sandbox',
+    'jobs.ai_scoring_sandbox',
+]
+
 def get_redis_connection():
     """Create Redis connection from URL."""
     return Redis.from_url(REDIS_URL)
 
+def preload_job_modules():
+    """Import job modules up front; failures are left for the job to report."""
+    loaded = 0
+    for module_name in JOB_MODULES:
+        try:
+            importlib.import_module(module_name)
+            loaded += 1
+        except Exception as e:
+            print(f"Could not preload {module_name}: {e}")
+    print(f"Preloaded {loaded}/{len(JOB_MODULES)} job modules")
+
 def main():
     """Start the RQ worker."""
     redis_conn = get_redis_connection()
@@ -39,6 +68,8 @@ def main():
     print(f"Connected to Redis: {REDIS_URL}")
     print(f"Listening on queues: {[q.name for q in queues]}")
 
+    preload_job_modules()
+
     # Start the worker
     worker = Worker(queues, connection=redis_conn)
     worker.work(with_scheduler=True)